@@ -1,32 +1,96 @@
 import bpy
+import os
+import sys
+import argparse
+import subprocess
 import math
+import time
+import heapq
+import bisect
+import numpy as np
 from mathutils import Vector
 from bpy.types import Operator
+from bpy.app.handlers import persistent
 from bpy.props import FloatProperty, BoolProperty, EnumProperty, IntProperty
 from operator import itemgetter
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 bl_info = {
     "name": "Distribute Objects",
     "author": "Your Name",
-    "version": (2, 20),
+    "version": (2, 29),
     "blender": (4, 4, 0),
-    "location": "Object > Distribute Objects or Search > Distribute Objects",
-    "description": "Distributes selected objects in rows, optionally centering active object at origin",
+    "location": "Object > Distribute Objects or Search > Distribute Objects, command line: blender --background --python distribute_objects.py -- --help",
+    "description": "Distributes selected objects in rows or a packed sheet, optionally centering active object at origin",
     "category": "Object",
 }
 
 def get_child_objects(obj, objects=None):
-    """Recursively collects all child objects."""
+    """Collects an object and all of its descendants, depth first."""
     if objects is None:
         objects = []
-    if obj not in objects:
-        objects.append(obj)
-    for child in obj.children:
-        get_child_objects(child, objects)
+    seen = set(objects)
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        objects.append(current)
+        stack.extend(reversed(current.children))
     return objects
 
-def get_object_size(obj):
+def read_vertex_coords(mesh_obj, depsgraph):
+    """Read the evaluated local vertex coordinates of a mesh object into an (N, 3) array."""
+    eval_obj = mesh_obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh(preserve_all_data_layers=False, depsgraph=depsgraph)
+    count = len(mesh.vertices)
+    coords = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    eval_obj.to_mesh_clear()
+    return coords.reshape(count, 3)
+
+def read_bound_box(mesh_obj, depsgraph):
+    """Read the 8 local corners of the evaluated bounding box of a mesh object, without copying the mesh."""
+    return np.array(mesh_obj.evaluated_get(depsgraph).bound_box, dtype=np.float64)
+
+def get_local_bounds_key(mesh_obj):
+    """Objects without modifiers evaluate to their shared mesh data, so they can share local bounds."""
+    if mesh_obj.modifiers:
+        return mesh_obj.as_pointer()
+    return mesh_obj.data.as_pointer()
+
+def get_world_bounds(mesh_objects, depsgraph, local_bounds=None, precision='EXACT'):
+    """Return world-space min and max corners of the evaluated meshes, reading vertices in bulk.
+    With a local_bounds dict, each unique mesh is scanned once and only its box corners are transformed.
+    With 'BOUND_BOX' precision only the evaluated bounding boxes are used."""
+    min_coords = np.full(3, np.inf)
+    max_coords = np.full(3, -np.inf)
+    
+    for mesh_obj in mesh_objects:
+        if precision == 'BOUND_BOX':
+            coords = read_bound_box(mesh_obj, depsgraph)
+        elif local_bounds is None:
+            coords = read_vertex_coords(mesh_obj, depsgraph)
+        else:
+            key = get_local_bounds_key(mesh_obj)
+            if key not in local_bounds:
+                local_coords = read_vertex_coords(mesh_obj, depsgraph)
+                local_bounds[key] = (local_coords.min(axis=0), local_coords.max(axis=0)) if len(local_coords) else None
+            if local_bounds[key] is None:
+                continue
+            low, high = local_bounds[key]
+            coords = np.array([(x, y, z) for x in (low[0], high[0]) for y in (low[1], high[1]) for z in (low[2], high[2])])
+        if len(coords):
+            matrix = np.array(mesh_obj.matrix_world, dtype=np.float64)
+            world_coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
+            np.minimum(min_coords, world_coords.min(axis=0), out=min_coords)
+            np.maximum(max_coords, world_coords.max(axis=0), out=max_coords)
+    
+    return Vector(min_coords), Vector(max_coords)
+
+def get_object_size(obj, local_bounds=None, precision='EXACT'):
     """Calculate the size and bounding box center of an object, including its children and modifiers."""
     mesh_objects = [o for o in get_child_objects(obj) if o.type == 'MESH']
     
@@ -38,22 +102,7 @@ def get_object_size(obj):
         return dims[0], dims[1], dims[2], center_x, center_y, min_z, max_z, center_z
     
     depsgraph = bpy.context.evaluated_depsgraph_get()
-    min_coords = Vector((float('inf'), float('inf'), float('inf')))
-    max_coords = Vector((-float('inf'), -float('inf'), -float('inf')))
-    
-    for mesh_obj in mesh_objects:
-        eval_obj = mesh_obj.evaluated_get(depsgraph)
-        mesh = eval_obj.to_mesh(preserve_all_data_layers=False, depsgraph=depsgraph)
-        matrix = mesh_obj.matrix_world
-        for vert in mesh.vertices:
-            world_vert = matrix @ vert.co
-            min_coords.x = min(min_coords.x, world_vert.x)
-            min_coords.y = min(min_coords.y, world_vert.y)
-            min_coords.z = min(min_coords.z, world_vert.z)
-            max_coords.x = max(max_coords.x, world_vert.x)
-            max_coords.y = max(max_coords.y, world_vert.y)
-            max_coords.z = max(max_coords.z, world_vert.z)
-        eval_obj.to_mesh_clear()
+    min_coords, max_coords = get_world_bounds(mesh_objects, depsgraph, local_bounds, precision)
     
     width = max_coords.x - min_coords.x
     depth = max_coords.y - min_coords.y
@@ -71,6 +120,108 @@ def get_object_size(obj):
     
     return width, depth, height, center_x, center_y, min_z, max_z, center_z
 
+def convex_hull_2d(points):
+    """Convex hull of an (N, 2) array as a counter-clockwise list of (x, y).
+    Points inside the octagon of extreme points are discarded in bulk before the monotone chain pass."""
+    if len(points) > 8:
+        sums = points[:, 0] + points[:, 1]
+        diffs = points[:, 0] - points[:, 1]
+        octagon = points[[
+            points[:, 0].argmin(), sums.argmin(), points[:, 1].argmin(), diffs.argmax(),
+            points[:, 0].argmax(), sums.argmax(), points[:, 1].argmax(), diffs.argmin(),
+        ]]
+        outside = np.zeros(len(points), dtype=bool)
+        for a, b in zip(octagon, np.roll(octagon, -1, axis=0)):
+            if (a == b).all():
+                continue
+            cross = (b[0] - a[0]) * (points[:, 1] - a[1]) - (b[1] - a[1]) * (points[:, 0] - a[0])
+            outside |= cross <= 0
+        points = points[outside]
+    
+    pts = [tuple(p) for p in np.unique(points, axis=0).tolist()]
+    if len(pts) < 3:
+        return pts
+    
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    
+    lower = []
+    for p in pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+def get_footprint_hull(obj, precision='EXACT'):
+    """Convex hull of an object's XY footprint, including children, relative to its world origin."""
+    mesh_objects = [o for o in get_child_objects(obj) if o.type == 'MESH']
+    origin = obj.matrix_world.translation
+    if not mesh_objects:
+        half = max(obj.dimensions) / 2
+        return [(-half, -half), (half, -half), (half, half), (-half, half)]
+    
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    footprints = []
+    for mesh_obj in mesh_objects:
+        if precision == 'BOUND_BOX':
+            coords = read_bound_box(mesh_obj, depsgraph)
+        else:
+            coords = read_vertex_coords(mesh_obj, depsgraph)
+        if len(coords):
+            matrix = np.array(mesh_obj.matrix_world, dtype=np.float64)
+            footprints.append(coords @ matrix[:2, :3].T + matrix[:2, 3] - (origin.x, origin.y))
+    if not footprints:
+        return [(0.0, 0.0)]
+    return convex_hull_2d(np.concatenate(footprints))
+
+_bounds_cache = {}
+
+FOOTPRINT_PROPERTY = "distribute_footprint"
+
+def get_bounds_key(objects):
+    """Identity of a hierarchy as it affects measured bounds: objects, mesh data and world matrices."""
+    return tuple(
+        (o.as_pointer(), o.data.as_pointer() if o.data else 0, tuple(v for row in o.matrix_world for v in row))
+        for o in objects
+    )
+
+def get_cached_measure(obj, mode, measure):
+    """Return measure(obj), reusing the result for a mode while geometry and transforms are unchanged."""
+    key = get_bounds_key(get_child_objects(obj))
+    cache_key = (obj.as_pointer(), mode)
+    entry = _bounds_cache.get(cache_key)
+    if entry and entry[0] == key:
+        return entry[1]
+    result = measure(obj)
+    pointers = frozenset(p for item in key for p in item[:2] if p)
+    _bounds_cache[cache_key] = (key, result, pointers)
+    return result
+
+def get_cached_object_size(obj, local_bounds=None, precision='EXACT'):
+    """Return get_object_size(obj), reusing the result while geometry and transforms are unchanged."""
+    return get_cached_measure(obj, (precision, local_bounds is not None), lambda o: get_object_size(o, local_bounds, precision))
+
+@persistent
+def invalidate_bounds_cache(scene, depsgraph):
+    """Drop cached bounds of hierarchies whose geometry was updated."""
+    if not _bounds_cache:
+        return
+    updated = {update.id.original.as_pointer() for update in depsgraph.updates if update.is_updated_geometry}
+    if not updated:
+        return
+    for cache_key, (key, result, pointers) in list(_bounds_cache.items()):
+        if pointers & updated:
+            del _bounds_cache[cache_key]
+
+@persistent
+def clear_bounds_cache(dummy):
+    _bounds_cache.clear()
+
 def sort_objects(objects_with_sizes, sort_method, center_active, active_object, group_by_name, name_prefix_length):
     """Sort objects based on specified method, optionally grouping by name prefix."""
     if center_active and active_object:
@@ -112,194 +263,478 @@ def sort_objects(objects_with_sizes, sort_method, center_active, active_object,
     
     return sorted_objects
 
-def distribute_objects(spacing, center_active, sort_method, z_alignment, group_by_name, name_prefix_length):
-    """Distribute objects in rows, centering active object or entire matrix at origin."""
-    for obj in bpy.context.selected_objects:
-        if obj.parent:
-            obj.select_set(False)
-    
-    selected_objects = [obj for obj in bpy.context.selected_objects if obj.type in ('MESH', 'ARMATURE')]
-    if not selected_objects:
-        return
-    
-    active_object = bpy.context.active_object if center_active and bpy.context.active_object in selected_objects else None
-    objects_with_sizes = [(obj, get_object_size(obj)) for obj in selected_objects]
-    sorted_objects = sort_objects(objects_with_sizes, sort_method, center_active, active_object, group_by_name, name_prefix_length)
-    
-    num_objects = len(selected_objects)
+def layout_rows(sorted_objects, spacing, center_active, active_object, group_by_name, name_prefix_length, verbose=False):
+    """Lay out objects in rows of similar width. Returns (obj, size, x, y) with bounding box centers."""
+    gap = max(spacing, 0.1)
+    num_objects = len(sorted_objects)
     num_rows = max(1, round(math.sqrt(num_objects)))
     central_row_idx = num_rows // 2
     
-    total_width = sum(size[0] for _, size in sorted_objects) + max(spacing, 0.1) * (num_objects - 1)
-    target_row_width = total_width / num_rows if num_rows > 0 else total_width
+    total_width = sum(size[0] for _, size in sorted_objects) + gap * (num_objects - 1)
+    max_fill_width = total_width / num_rows * 1.1
     
     rows = [[] for _ in range(num_rows)]
+    row_object_widths = [0.0] * num_rows
     if center_active and active_object:
-        active_item = next((obj, size) for obj, size in sorted_objects if obj == active_object)
+        active_item = next(item for item in sorted_objects if item[0] == active_object)
         sorted_objects = [item for item in sorted_objects if item[0] != active_object]
         rows[central_row_idx].append(active_item)
+        row_object_widths[central_row_idx] = active_item[1][0]
     
+    current_row_idx = 0
+    current_width = row_object_widths[current_row_idx]
     if group_by_name:
-        groups = defaultdict(list)
-        for obj, size in sorted_objects:
-            prefix = obj.name[:min(len(obj.name), name_prefix_length)]
-            groups[prefix].append((obj, size))
-        sorted_groups = []
-        for obj, size in sorted_objects:
-            prefix = obj.name[:min(len(obj.name), name_prefix_length)]
-            if prefix in groups:
-                sorted_groups.append((prefix, groups[prefix]))
-                del groups[prefix]
-        current_row_idx = 0
-        current_width = sum(size[0] for _, size in rows[current_row_idx]) if rows[current_row_idx] else 0
-        for prefix, group in sorted_groups:
-            group_width = sum(size[0] for _, size in group) + max(spacing, 0.1) * (len(group) - 1)
-            if current_width + group_width <= target_row_width * 1.1 or not rows[current_row_idx]:
-                rows[current_row_idx].extend(group)
-                current_width += group_width
-            else:
+        groups = {}
+        for item in sorted_objects:
+            groups.setdefault(item[0].name[:name_prefix_length], []).append(item)
+        for group in groups.values():
+            group_object_width = sum(size[0] for _, size in group)
+            group_width = group_object_width + gap * (len(group) - 1)
+            if current_width + group_width > max_fill_width and rows[current_row_idx]:
                 current_row_idx = (current_row_idx + 1) % num_rows
-                current_width = sum(size[0] for _, size in rows[current_row_idx]) if rows[current_row_idx] else 0
-                rows[current_row_idx].extend(group)
-                current_width += group_width
+                current_width = row_object_widths[current_row_idx]
+            rows[current_row_idx].extend(group)
+            row_object_widths[current_row_idx] += group_object_width
+            current_width += group_width
     else:
-        current_row_idx = 0
-        current_width = sum(size[0] for _, size in rows[current_row_idx]) if rows[current_row_idx] else 0
-        for obj, size in sorted_objects:
-            obj_width = size[0]
-            if current_width + obj_width + (len(rows[current_row_idx]) * max(spacing, 0.1)) <= target_row_width * 1.1 or not rows[current_row_idx]:
-                rows[current_row_idx].append((obj, size))
-                current_width += obj_width
-            else:
+        for item in sorted_objects:
+            obj_width = item[1][0]
+            if current_width + obj_width + len(rows[current_row_idx]) * gap > max_fill_width and rows[current_row_idx]:
                 current_row_idx = (current_row_idx + 1) % num_rows
-                current_width = sum(size[0] for _, size in rows[current_row_idx]) if rows[current_row_idx] else 0
-                rows[current_row_idx].append((obj, size))
-                current_width += obj_width
+                current_width = row_object_widths[current_row_idx]
+            rows[current_row_idx].append(item)
+            row_object_widths[current_row_idx] += obj_width
+            current_width += obj_width
     
     rows = rows[::-1]
+    row_object_widths = row_object_widths[::-1]
     central_row = rows[central_row_idx]
     
     if center_active and central_row and active_object:
-        try:
-            active_item = next((obj, size) for obj, size in central_row if obj == active_object)
-            central_row.remove(active_item)
-            mid_idx = len(central_row) // 2
-            central_row.insert(mid_idx, active_item)
-        except StopIteration:
-            pass
+        active_pos = next((i for i, (obj, _) in enumerate(central_row) if obj == active_object), None)
+        if active_pos is not None:
+            active_item = central_row.pop(active_pos)
+            central_row.insert(len(central_row) // 2, active_item)
     elif central_row and not center_active:
-        max_obj = max(central_row, key=lambda x: x[1][0])
-        central_row.remove(max_obj)
-        mid_idx = len(central_row) // 2
-        central_row.insert(mid_idx, max_obj)
+        max_pos = max(range(len(central_row)), key=lambda i: central_row[i][1][0])
+        max_item = central_row.pop(max_pos)
+        central_row.insert(len(central_row) // 2, max_item)
+    
+    row_widths = [row_object_widths[i] + gap * (len(row) - 1) if row else 0 for i, row in enumerate(rows)]
+    row_depths = [max(size[1] for _, size in row) if row else 0 for row in rows]
+    max_row_width = max(row_widths)
     
+    # Rows grow outward from the central row; each step only depends on its neighbour
     row_y_positions = [0] * num_rows
-    max_row_width = 0
-    row_widths = []
-    row_depths = []
-    
-    for row_idx in range(num_rows):
-        row = rows[row_idx]
-        row_depth = max(size[1] for _, size in row) if row else 0
-        row_width = sum(size[0] for _, size in row) + max(spacing, 0.1) * (len(row) - 1) if row else 0
-        row_widths.append(row_width)
-        row_depths.append(row_depth)
-        max_row_width = max(max_row_width, row_width)
-    
-    for row_idx in range(num_rows):
-        if row_idx == central_row_idx:
-            row_y_positions[row_idx] = 0
-        elif row_idx < central_row_idx:
-            y = 0
-            for j in range(row_idx + 1, central_row_idx + 1):
-                if rows[j]:
-                    prev_depth = max(size[1] for _, size in rows[j]) if j == central_row_idx else row_depths[j]
-                    curr_depth = row_depths[row_idx] if j == row_idx + 1 else row_depths[j - 1]
-                    y -= (prev_depth / 2 + curr_depth / 2 + max(spacing, 0.1))
-            row_y_positions[row_idx] = y
-        else:
-            y = 0
-            for j in range(central_row_idx, row_idx):
-                if rows[j]:
-                    prev_depth = row_depths[j]
-                    curr_depth = row_depths[row_idx] if j == row_idx - 1 else row_depths[j + 1]
-                    y += (prev_depth / 2 + curr_depth / 2 + max(spacing, 0.1))
-            row_y_positions[row_idx] = y
-    
-    positions = []
+    for row_idx in range(central_row_idx - 1, -1, -1):
+        step = row_depths[row_idx + 1] / 2 + row_depths[row_idx] / 2 + gap if rows[row_idx + 1] else 0
+        row_y_positions[row_idx] = row_y_positions[row_idx + 1] - step
+    for row_idx in range(central_row_idx + 1, num_rows):
+        step = row_depths[row_idx - 1] / 2 + row_depths[row_idx] / 2 + gap if rows[row_idx - 1] else 0
+        row_y_positions[row_idx] = row_y_positions[row_idx - 1] + step
+    
+    placements = []
+    ref_x = None
+    min_x = min_y = float('inf')
+    max_x = max_y = -float('inf')
     for row_idx, row in enumerate(rows):
         if not row:
-            positions.extend([(0, row_y_positions[row_idx])] if row_idx == central_row_idx else [])
             continue
-        num_objects_in_row = len(row)
-        total_object_width = sum(size[0] for _, size in row)
-        spacing_adjusted = (max_row_width - total_object_width) / (num_objects_in_row - 1) if num_objects_in_row > 1 else max(spacing, 0.1)
+        y = row_y_positions[row_idx]
+        spacing_adjusted = (max_row_width - row_object_widths[row_idx]) / (len(row) - 1) if len(row) > 1 else gap
         start_x = -max_row_width / 2
-        row_positions = [None] * num_objects_in_row
-        for i in range(num_objects_in_row):
-            obj, (width, depth, height, center_x, center_y, min_z, max_z, center_z) = row[i]
-            x = start_x + width / 2
-            row_positions[i] = (x, row_y_positions[row_idx])
-            start_x += width + spacing_adjusted
-        positions.extend([p for p in row_positions if p is not None])
-    
-    # Center the entire matrix when center_active is False
+        for obj, size in row:
+            x = start_x + size[0] / 2
+            placements.append((obj, size, x, y))
+            start_x += size[0] + spacing_adjusted
+            if obj == active_object:
+                ref_x = x
+        min_x = min(min_x, placements[-len(row)][2])
+        max_x = max(max_x, placements[-1][2])
+        min_y = min(min_y, y)
+        max_y = max(max_y, y)
+        if verbose:
+            row_width = placements[-1][2] - placements[-len(row)][2] + max(size[0] for _, size in row)
+            print(f"Row {row_idx} width: {row_width}")
+    
     if not center_active:
-        # Calculate bounding box of all positions
-        min_x = min(x for x, _ in positions) if positions else 0
-        max_x = max(x for x, _ in positions) if positions else 0
-        min_y = min(y for _, y in positions) if positions else 0
-        max_y = max(y for _, y in positions) if positions else 0
         center_x = (min_x + max_x) / 2
         center_y = (min_y + max_y) / 2
-        # Shift positions to center the matrix at (0, 0)
-        positions = [(x - center_x, y - center_y) for x, y in positions]
+        return [(obj, size, x - center_x, y - center_y) for obj, size, x, y in placements]
+    
+    if ref_x is None:
+        ref_x = placements[0][2]
+    return [(obj, size, x - ref_x, y) for obj, size, x, y in placements]
+
+def pack_skyline(rects, sheet_width, skyline=None):
+    """Bottom-left skyline packing of (width, depth) rectangles. Returns the lower-left corner of each.
+    An initial skyline of [x, height, width] segments lets packing continue on top of an existing sheet.
+    Each rectangle costs one sliding-window pass over the skyline segments, O(n * segments) in total."""
+    skyline = [list(segment) for segment in skyline] if skyline else [[0.0, 0.0, sheet_width]]
+    corners = []
+    for width, depth in rects:
+        best = None
+        # Segments [i, j) under the rectangle, with the indices of their falling maximum heights in window
+        window = deque()
+        right = 0.0
+        j = 0
+        for i in range(len(skyline)):
+            x = skyline[i][0]
+            if x + width > sheet_width + 1e-9 and i > 0:
+                break
+            while (j <= i or right - x < width - 1e-9) and j < len(skyline):
+                while window and skyline[window[-1]][1] <= skyline[j][1]:
+                    window.pop()
+                window.append(j)
+                right = skyline[j][0] + skyline[j][2]
+                j += 1
+            y = skyline[window[0]][1]
+            if best is None or (y + depth, y) < best[:2]:
+                best = (y + depth, y, i, x)
+            if window[0] == i:
+                window.popleft()
+        top, y, i, x = best
+        corners.append((x, y))
+        
+        right = x + width
+        new_skyline = skyline[:i] + [[x, top, width]]
+        for seg_x, seg_y, seg_w in skyline[i:]:
+            seg_right = seg_x + seg_w
+            if seg_right <= right + 1e-9:
+                continue
+            if seg_x < right:
+                seg_x, seg_w = right, seg_right - right
+            new_skyline.append([seg_x, seg_y, seg_w])
+        skyline = []
+        for segment in new_skyline:
+            if skyline and skyline[-1][1] == segment[1]:
+                skyline[-1][2] += segment[2]
+            else:
+                skyline.append(segment)
+    return corners
+
+def layout_skyline(sorted_objects, spacing, center_active, active_object):
+    """Pack object footprints with a skyline packer. Returns (obj, size, x, y) with bounding box centers."""
+    gap = max(spacing, 0.1)
+    rects = [(size[0] + gap, size[1] + gap) for _, size in sorted_objects]
+    total_area = sum(w * d for w, d in rects)
+    sheet_width = max(math.sqrt(total_area), max(w for w, _ in rects))
+    corners = pack_skyline(rects, sheet_width)
+    
+    placements = [
+        (obj, size, x + w / 2, y + d / 2)
+        for (obj, size), (x, y), (w, d) in zip(sorted_objects, corners, rects)
+    ]
+    
+    return center_placements(placements, center_active, active_object)
+
+def center_placements(placements, center_active, active_object):
+    """Shift a packed sheet so the active object, or else the whole sheet, is centered at the origin."""
+    if center_active and active_object:
+        ref_x, ref_y = next((x, y) for obj, _, x, y in placements if obj == active_object)
     else:
-        # Center on active object
-        ref_center_x = None
-        ref_pos_idx = sum(len(r) for r in rows[:central_row_idx]) + next(i for i, (obj, _) in enumerate(central_row) if obj == active_object) if active_object and central_row else 0
-        if positions and ref_pos_idx < len(positions):
-            ref_center_x = positions[ref_pos_idx][0]
-            positions = [(x - ref_center_x, y) for x, y in positions]
-    
-    final_row_widths = []
-    for row_idx, row in enumerate(rows):
-        if row:
-            x_positions = [positions[i][0] for i in range(sum(len(r) for r in rows[:row_idx]), sum(len(r) for r in rows[:row_idx + 1]))]
-            row_width = max(x_positions) - min(x_positions) + max(size[0] for _, size in row)
-            final_row_widths.append(row_width)
+        ref_x = (min(x - size[0] / 2 for _, size, x, _ in placements) + max(x + size[0] / 2 for _, size, x, _ in placements)) / 2
+        ref_y = (min(y - size[1] / 2 for _, size, _, y in placements) + max(y + size[1] / 2 for _, size, _, y in placements)) / 2
+    return [(obj, size, x - ref_x, y - ref_y) for obj, size, x, y in placements]
+
+def skyline_from_rects(rects, left, right, base):
+    """Height profile of the tops of (min_x, min_y, max_x, max_y) rects over [left, right],
+    as skyline segments with x relative to left. Uncovered spans sit at base."""
+    edges = sorted({left, right} | {r[0] for r in rects} | {r[2] for r in rects})
+    by_start = sorted(rects)
+    tops = []
+    skyline = []
+    i = 0
+    for a, b in zip(edges, edges[1:]):
+        while i < len(by_start) and by_start[i][0] <= a:
+            heapq.heappush(tops, (-by_start[i][3], by_start[i][2]))
+            i += 1
+        while tops and tops[0][1] <= a:
+            heapq.heappop(tops)
+        height = -tops[0][0] if tops else base
+        if skyline and skyline[-1][1] == height:
+            skyline[-1][2] += b - a
         else:
-            final_row_widths.append(0)
-    
-    print(f"Final row widths: {final_row_widths}")
+            skyline.append([a - left, height, b - a])
+    return skyline
+
+def get_stored_footprint(obj):
+    """World XY footprint (min_x, min_y, max_x, max_y) stored by a previous layout, or None."""
+    footprint = obj.get(FOOTPRINT_PROPERTY)
+    if footprint is None:
+        return None
+    loc = obj.location
+    return (loc.x + footprint[0], loc.y + footprint[1], loc.x + footprint[2], loc.y + footprint[3])
+
+def layout_append(sorted_objects, placed_footprints, spacing):
+    """Fit new objects into the free space above an existing layout. Returns (obj, size, x, y) with bounding box centers."""
+    gap = max(spacing, 0.1)
+    inflated = [(r[0] - gap / 2, r[1] - gap / 2, r[2] + gap / 2, r[3] + gap / 2) for r in placed_footprints]
+    left = min(r[0] for r in inflated)
+    right = max(r[2] for r in inflated)
+    base = min(r[1] for r in inflated)
+    rects = [(size[0] + gap, size[1] + gap) for _, size in sorted_objects]
+    
+    skyline = skyline_from_rects(inflated, left, right, base)
+    sheet_width = right - left
+    widest = max(w for w, _ in rects)
+    if widest > sheet_width:
+        skyline.append([sheet_width, base, widest - sheet_width])
+        sheet_width = widest
+    corners = pack_skyline(rects, sheet_width, skyline)
+    
+    return [
+        (obj, size, left + x + w / 2, y + d / 2)
+        for (obj, size), (x, y), (w, d) in zip(sorted_objects, corners, rects)
+    ]
+
+def inflate_polygon(polygon, distance):
+    """Offset a counter-clockwise convex polygon outward by distance, with a miter limit at sharp corners."""
+    if len(polygon) < 3:
+        xs = [p[0] for p in polygon] or [0.0]
+        ys = [p[1] for p in polygon] or [0.0]
+        left, bottom, right, top = min(xs) - distance, min(ys) - distance, max(xs) + distance, max(ys) + distance
+        return [(left, bottom), (right, bottom), (right, top), (left, top)]
+    normals = []
+    for (x0, y0), (x1, y1) in zip(polygon, polygon[1:] + polygon[:1]):
+        length = math.hypot(x1 - x0, y1 - y0) or 1.0
+        normals.append(((y1 - y0) / length, (x0 - x1) / length))
+    inflated = []
+    for i, (x, y) in enumerate(polygon):
+        n1 = normals[i - 1]
+        n2 = normals[i]
+        dot = n1[0] * n2[0] + n1[1] * n2[1]
+        if 1 + dot > 0.125:
+            scale = distance / (1 + dot)
+            inflated.append((x + (n1[0] + n2[0]) * scale, y + (n1[1] + n2[1]) * scale))
+        else:
+            inflated.append((x + n1[0] * distance, y + n1[1] * distance))
+            inflated.append((x + n2[0] * distance, y + n2[1] * distance))
+    return inflated
+
+def make_drop_shape(polygon):
+    """Split a convex polygon into lower and upper chains, as x-sorted (xs, ys) lists, plus its bounds."""
+    hull = convex_hull_2d(np.array(polygon, dtype=np.float64))
+    left = min(range(len(hull)), key=lambda i: (hull[i][0], hull[i][1]))
+    right = max(range(len(hull)), key=lambda i: (hull[i][0], -hull[i][1]))
+    ordered = hull[left:] + hull[:left]
+    split = (right - left) % len(hull)
+    lower = ordered[:split + 1]
+    upper = [ordered[0]] + ordered[split:][::-1]
+    
+    def squash(chain, pick):
+        xs, ys = [], []
+        for x, y in chain:
+            if xs and x == xs[-1]:
+                ys[-1] = pick(ys[-1], y)
+            else:
+                xs.append(x)
+                ys.append(y)
+        return xs, ys
     
+    xs = [p[0] for p in hull]
+    ys = [p[1] for p in hull]
+    return squash(lower, min), squash(upper, max), (min(xs), min(ys), max(xs), max(ys))
+
+def chain_value(chain, x):
+    """Evaluate a piecewise linear chain at x, clamped to its ends."""
+    xs, ys = chain
+    i = bisect.bisect_left(xs, x)
+    if i <= 0:
+        return ys[0]
+    if i >= len(xs):
+        return ys[-1]
+    t = (x - xs[i - 1]) / (xs[i] - xs[i - 1])
+    return ys[i - 1] + (ys[i] - ys[i - 1]) * t
+
+def drop_height(shape, px, placed_shape, qx, qy):
+    """Lowest y offset at which shape, shifted by px, rests on top of a placed shape at (qx, qy), or None if they do not overlap in X."""
+    lower, _, (min_x, _, max_x, _) = shape
+    _, upper, (q_min_x, _, q_max_x, _) = placed_shape
+    lo = max(min_x + px, q_min_x + qx)
+    hi = min(max_x + px, q_max_x + qx)
+    if hi - lo <= 1e-9:
+        return None
+    samples = [lo, hi]
+    samples.extend(x + qx for x in upper[0] if lo < x + qx < hi)
+    samples.extend(x + px for x in lower[0] if lo < x + px < hi)
+    return max(chain_value(upper, x - qx) + qy - chain_value(lower, x - px) for x in samples)
+
+def pack_hulls(items, sheet_width, cell_size, candidate_count=12, recent_count=6):
+    """Drop convex shapes into a sheet of fixed width, bottom-left first.
+    Each item is a list of alternative shapes (e.g. rotations). Returns (shape index, x, y) per item.
+    Placed shapes are indexed in X columns so each drop only tests shapes under its own footprint."""
+    columns = defaultdict(list)
+    placed = []
+    results = []
+    for shapes in items:
+        best = None
+        for shape_idx, shape in enumerate(shapes):
+            min_x, min_y, max_x, max_y = shape[2]
+            low = -min_x
+            high = max(low, sheet_width - max_x)
+            candidates = {low + (high - low) * i / (candidate_count - 1) for i in range(candidate_count)}
+            for q_shape, qx, qy in placed[-recent_count:]:
+                candidates.add(q_shape[2][2] + qx - min_x)
+                candidates.add(q_shape[2][0] + qx - max_x)
+            for px in candidates:
+                if px < low - 1e-9 or px > high + 1e-9:
+                    continue
+                nearby = set()
+                for column in range(math.floor((min_x + px) / cell_size), math.floor((max_x + px) / cell_size) + 1):
+                    nearby.update(columns.get(column, ()))
+                rest_y = -min_y
+                for index in sorted(nearby, key=lambda i: -(placed[i][0][2][3] + placed[i][2])):
+                    q_shape, qx, qy = placed[index]
+                    if q_shape[2][3] + qy - min_y <= rest_y:
+                        break
+                    height = drop_height(shape, px, q_shape, qx, qy)
+                    if height is not None and height > rest_y:
+                        rest_y = height
+                score = (rest_y + max_y, px + min_x)
+                if best is None or score < best[0]:
+                    best = (score, shape_idx, px, rest_y)
+        _, shape_idx, px, py = best
+        shape = shapes[shape_idx]
+        index = len(placed)
+        placed.append((shape, px, py))
+        for column in range(math.floor((shape[2][0] + px) / cell_size), math.floor((shape[2][2] + px) / cell_size) + 1):
+            columns[column].append(index)
+        results.append((shape_idx, px, py))
+    return results
+
+def layout_hulls(sorted_objects, spacing, center_active, active_object, precision='EXACT', allow_rotation=False):
+    """Pack convex object footprints, optionally turning objects by 90 degrees.
+    Returns (obj, size, x, y) with bounding box centers, whose size holds world offsets from the origin,
+    and the objects that have to be rotated."""
+    gap = max(spacing, 0.1)
+    items = []
+    footprints = []
+    for obj, size in sorted_objects:
+        hull = get_cached_measure(obj, ('HULL', precision), lambda o: get_footprint_hull(o, precision))
+        variants = [hull]
+        if allow_rotation and obj.rotation_mode in ('XYZ', 'YXZ'):
+            variants.append([(-y, x) for x, y in hull])
+        footprints.append(variants)
+        items.append([make_drop_shape(inflate_polygon(variant, gap / 2)) for variant in variants])
+    
+    total_area = sum((s[0][2][2] - s[0][2][0]) * (s[0][2][3] - s[0][2][1]) for s in items)
+    widest = max(s[0][2][2] - s[0][2][0] for s in items)
+    sheet_width = max(math.sqrt(total_area), widest)
+    cell_size = sheet_width / max(1, round(math.sqrt(len(items))))
+    
+    placements = []
+    rotated = []
+    for (obj, size), variants, (shape_idx, px, py) in zip(sorted_objects, footprints, pack_hulls(items, sheet_width, cell_size)):
+        xs = [p[0] for p in variants[shape_idx]]
+        ys = [p[1] for p in variants[shape_idx]]
+        offset_x = (min(xs) + max(xs)) / 2
+        offset_y = (min(ys) + max(ys)) / 2
+        footprint_size = (max(xs) - min(xs), max(ys) - min(ys), size[2], offset_x, offset_y) + tuple(size[5:])
+        placements.append((obj, footprint_size, px + offset_x, py + offset_y))
+        if shape_idx:
+            rotated.append(obj)
+    
+    return center_placements(placements, center_active, active_object), rotated
+
+def layout_density(placements):
+    """Ratio of total footprint area to the area of the layout's bounding rectangle."""
+    if not placements:
+        return 0.0
+    min_x = min(x - size[0] / 2 for _, size, x, _ in placements)
+    max_x = max(x + size[0] / 2 for _, size, x, _ in placements)
+    min_y = min(y - size[1] / 2 for _, size, _, y in placements)
+    max_y = max(y + size[1] / 2 for _, size, _, y in placements)
+    bounds_area = (max_x - min_x) * (max_y - min_y)
+    footprint_area = sum(size[0] * size[1] for _, size, _, _ in placements)
+    return footprint_area / bounds_area if bounds_area > 0 else 0.0
+
+def apply_layout(placements, z_alignment, verbose=False):
+    """Move objects so their bounding box centers land on the laid out positions."""
     assigned_positions = []
-    pos_idx = 0
-    for row_idx, row in enumerate(rows):
-        for obj, size in row:
-            x, y = positions[pos_idx]
-            center_x, center_y, min_z, max_z, center_z = size[3], size[4], size[5], size[6], size[7]
-            if z_alignment == 'PIVOT':
-                z = 0
-            elif z_alignment == 'CENTER':
-                z = -center_z
-            elif z_alignment == 'BOTTOM':
-                z = -min_z
-            elif z_alignment == 'TOP':
-                z = -max_z
-            loc_x = x - center_x
-            loc_y = y - center_y
-            loc_z = z
-            assigned_positions.append((obj, loc_x, loc_y, loc_z))
-            pos_idx += 1
+    for obj, size, x, y in placements:
+        center_x, center_y, min_z, max_z, center_z = size[3], size[4], size[5], size[6], size[7]
+        if z_alignment == 'PIVOT':
+            z = 0
+        elif z_alignment == 'CENTER':
+            z = -center_z
+        elif z_alignment == 'BOTTOM':
+            z = -min_z
+        elif z_alignment == 'TOP':
+            z = -max_z
+        loc_x = x - center_x
+        loc_y = y - center_y
+        loc_z = z
+        assigned_positions.append((obj, loc_x, loc_y, loc_z))
+        obj[FOOTPRINT_PROPERTY] = (
+            x - size[0] / 2 - loc_x, y - size[1] / 2 - loc_y,
+            x + size[0] / 2 - loc_x, y + size[1] / 2 - loc_y,
+        )
     
     for obj, loc_x, loc_y, loc_z in assigned_positions:
         obj.location.x = loc_x
         obj.location.y = loc_y
         obj.location.z = loc_z
-        center_x = loc_x + obj.get('center_x', 0)
-        center_y = loc_y + obj.get('center_y', 0)
-        print(f"Object {obj.name}: x={loc_x}, y={loc_y}, z={loc_z}, center_x={center_x}, center_y={center_y}")
+        if verbose:
+            print(f"Object {obj.name}: x={loc_x}, y={loc_y}, z={loc_z}")
+
+def distribute_objects(spacing, center_active, sort_method, z_alignment, group_by_name, name_prefix_length, layout_mode='ROWS', share_mesh_bounds=False, precision='EXACT', append=False, verbose=False, objects=None, allow_rotation=False):
+    """Distribute objects in rows or a packed sheet, centering active object or entire layout at origin.
+    Works on the selection unless objects are given.
+    With append, objects that already carry a stored placement stay put and only the others are fitted in.
+    Returns the packing density of the layout and, when a different layout was chosen, of the row layout."""
+    if objects is None:
+        for obj in bpy.context.selected_objects:
+            if obj.parent:
+                obj.select_set(False)
+        objects = bpy.context.selected_objects
+    else:
+        objects = [obj for obj in objects if not obj.parent]
+    
+    selected_objects = [obj for obj in objects if obj.type in ('MESH', 'ARMATURE')]
+    
+    placed = []
+    if append:
+        new_objects = [obj for obj in selected_objects if FOOTPRINT_PROPERTY not in obj]
+        new_set = set(new_objects)
+        for obj in bpy.context.view_layer.objects:
+            footprint = get_stored_footprint(obj) if obj not in new_set else None
+            if footprint is not None:
+                placed.append((obj, footprint))
+        selected_objects = new_objects
+    if not selected_objects:
+        return 0.0, None
+    
+    active_object = bpy.context.active_object if center_active and bpy.context.active_object in selected_objects else None
+    local_bounds = {} if share_mesh_bounds else None
+    objects_with_sizes = [(obj, get_cached_object_size(obj, local_bounds, precision)) for obj in selected_objects]
+    
+    if placed:
+        sorted_objects = sort_objects(objects_with_sizes, sort_method, False, None, group_by_name, name_prefix_length)
+        placements = layout_append(sorted_objects, [footprint for _, footprint in placed], spacing)
+        apply_layout(placements, z_alignment, verbose)
+        existing = [
+            (obj, (r[2] - r[0], r[3] - r[1]), (r[0] + r[2]) / 2, (r[1] + r[3]) / 2)
+            for obj, r in placed
+        ]
+        return layout_density(existing + placements), None
+    
+    sorted_objects = sort_objects(objects_with_sizes, sort_method, center_active, active_object, group_by_name, name_prefix_length)
+    row_placements = layout_rows(sorted_objects, spacing, center_active, active_object, group_by_name, name_prefix_length, verbose)
+    row_density = layout_density(row_placements)
+    if layout_mode == 'SKYLINE':
+        placements = layout_skyline(sorted_objects, spacing, center_active, active_object)
+        apply_layout(placements, z_alignment, verbose)
+        return layout_density(placements), row_density
+    if layout_mode == 'HULL':
+        placements, rotated = layout_hulls(sorted_objects, spacing, center_active, active_object, precision, allow_rotation)
+        for obj in rotated:
+            obj.rotation_euler.z += math.pi / 2
+        apply_layout(placements, z_alignment, verbose)
+        return layout_density(placements), row_density
+    
+    apply_layout(row_placements, z_alignment, verbose)
+    return row_density, None
 
 class OBJECT_OT_DistributeObjects(Operator):
     """Distribute selected objects in rows, optionally centering active object at origin"""
@@ -345,6 +780,45 @@ class OBJECT_OT_DistributeObjects(Operator):
         default='BOTTOM'
     )
     
+    layout_mode: EnumProperty(
+        name="Layout",
+        description="How object footprints are arranged",
+        items=[
+            ('ROWS', "Rows", "Arrange objects in rows of similar width"),
+            ('SKYLINE', "Skyline Packing", "Pack object footprints tightly with a skyline rectangle packer"),
+            ('HULL', "Convex Footprints", "Pack the convex hulls of object footprints, for long diagonal or L-shaped objects"),
+        ],
+        default='ROWS'
+    )
+    
+    precision: EnumProperty(
+        name="Precision",
+        description="How object bounds are measured",
+        items=[
+            ('EXACT', "Exact Vertices", "Measure every evaluated vertex of the object and its children"),
+            ('BOUND_BOX', "Evaluated Bounding Boxes", "Use the 8 corners of each evaluated bounding box, without copying meshes"),
+        ],
+        default='EXACT'
+    )
+    
+    share_mesh_bounds: BoolProperty(
+        name="Shared Mesh Bounds",
+        description="Measure each unique mesh once and reuse its bounding box for linked duplicates. Exact for unrotated instances, slightly larger for rotated ones",
+        default=False
+    )
+    
+    allow_rotation: BoolProperty(
+        name="Allow 90° Rotation",
+        description="Let the convex footprint packer turn objects by 90 degrees around Z when that packs them tighter",
+        default=False
+    )
+    
+    append_to_layout: BoolProperty(
+        name="Append to Layout",
+        description="Keep objects placed by a previous run where they are and fit only selected objects without a stored placement into free space",
+        default=False
+    )
+    
     group_by_name: BoolProperty(
         name="Group by Name",
         description="Group objects by the prefix of their names",
@@ -365,6 +839,13 @@ class OBJECT_OT_DistributeObjects(Operator):
             layout.prop(self, "center_active")
         layout.prop(self, "sort_method")
         layout.prop(self, "z_alignment")
+        layout.prop(self, "layout_mode")
+        if self.layout_mode == 'HULL':
+            layout.prop(self, "allow_rotation")
+        layout.prop(self, "append_to_layout")
+        layout.prop(self, "precision")
+        if self.precision == 'EXACT':
+            layout.prop(self, "share_mesh_bounds")
         layout.prop(self, "group_by_name")
         if self.group_by_name:
             layout.prop(self, "name_prefix_length")
@@ -374,26 +855,122 @@ class OBJECT_OT_DistributeObjects(Operator):
         return context.mode == 'OBJECT' and len([obj for obj in context.selected_objects if obj.type in ('MESH', 'ARMATURE')]) > 0
     
     def execute(self, context):
-        distribute_objects(
+        start_time = time.perf_counter()
+        density, row_density = distribute_objects(
             self.spacing,
             self.center_active and context.active_object and context.active_object in context.selected_objects,
             self.sort_method,
             self.z_alignment,
             self.group_by_name,
-            self.name_prefix_length
+            self.name_prefix_length,
+            self.layout_mode,
+            self.share_mesh_bounds,
+            self.precision,
+            self.append_to_layout,
+            allow_rotation=self.allow_rotation
         )
+        message = f"Distributed objects in {time.perf_counter() - start_time:.2f}s, packing density {density:.0%}"
+        if row_density is not None:
+            message += f" (rows {row_density:.0%})"
+        self.report({'INFO'}, message)
         return {'FINISHED'}
 
+def parse_batch_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="blender --background --python distribute_objects.py --",
+        description="Distribute the objects of a collection in each .blend file and save it",
+    )
+    parser.add_argument("files", nargs="+", help=".blend files to process")
+    parser.add_argument("--collection", default="", help="Collection to distribute (default: the scene collection)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of Blender processes to run at once")
+    parser.add_argument("--spacing", type=float, default=5.0)
+    parser.add_argument("--sort-method", default='AVG', choices=['WIDTH', 'X_PLUS_Y', 'X_PLUS_Y_PLUS_Z', 'AVG', 'MAX'])
+    parser.add_argument("--z-alignment", default='BOTTOM', choices=['PIVOT', 'CENTER', 'BOTTOM', 'TOP'])
+    parser.add_argument("--layout", default='ROWS', choices=['ROWS', 'SKYLINE', 'HULL'])
+    parser.add_argument("--allow-rotation", action="store_true")
+    parser.add_argument("--precision", default='EXACT', choices=['EXACT', 'BOUND_BOX'])
+    parser.add_argument("--share-mesh-bounds", action="store_true")
+    parser.add_argument("--no-group-by-name", dest="group_by_name", action="store_false")
+    parser.add_argument("--name-prefix-length", type=int, default=5)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def batch_distribute(args):
+    """Worker side: distribute the collection of the currently open file and save it."""
+    if args.collection:
+        collection = bpy.data.collections.get(args.collection)
+        if collection is None:
+            print(f"Distribute Objects: collection '{args.collection}' not found in {bpy.data.filepath}")
+            return 1
+    else:
+        collection = bpy.context.scene.collection
+    
+    density, _ = distribute_objects(
+        args.spacing,
+        False,
+        args.sort_method,
+        args.z_alignment,
+        args.group_by_name,
+        args.name_prefix_length,
+        args.layout,
+        args.share_mesh_bounds,
+        args.precision,
+        objects=list(collection.all_objects),
+        allow_rotation=args.allow_rotation,
+    )
+    bpy.ops.wm.save_mainfile()
+    print(f"Distribute Objects: {bpy.data.filepath} packing density {density:.0%}")
+    return 0
+
+def run_batch_worker(filepath, worker_argv):
+    command = [
+        bpy.app.binary_path, "--background", "--factory-startup", filepath,
+        # Blender exits with 0 after an exception in the script unless told otherwise
+        "--python-exit-code", "1",
+        "--python", os.path.abspath(__file__), "--", "--worker", *worker_argv, filepath,
+    ]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return filepath, result.returncode, result.stdout
+
+def batch_main(argv):
+    """Command line entry point: one background Blender process per .blend file, run in parallel."""
+    args = parse_batch_args(argv)
+    if args.worker:
+        return batch_distribute(args)
+    
+    worker_argv = [arg for arg in argv if arg not in args.files]
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        for filepath, returncode, output in executor.map(lambda f: run_batch_worker(f, worker_argv), args.files):
+            if returncode != 0:
+                failed += 1
+                print(f"Distribute Objects: failed on {filepath}\n{output}")
+            else:
+                print(f"Distribute Objects: done {filepath}")
+    print(f"Distribute Objects: processed {len(args.files) - failed}/{len(args.files)} files")
+    return 1 if failed else 0
+
 def menu_func(self, context):
     self.layout.operator(OBJECT_OT_DistributeObjects.bl_idname)
 
 def register():
     bpy.utils.register_class(OBJECT_OT_DistributeObjects)
     bpy.types.VIEW3D_MT_object.append(menu_func)
+    if invalidate_bounds_cache not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(invalidate_bounds_cache)
+    if clear_bounds_cache not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(clear_bounds_cache)
 
 def unregister():
+    if invalidate_bounds_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_bounds_cache)
+    if clear_bounds_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_bounds_cache)
+    _bounds_cache.clear()
     bpy.utils.unregister_class(OBJECT_OT_DistributeObjects)
     bpy.types.VIEW3D_MT_object.remove(menu_func)
 
 if __name__ == "__main__":
+    if "--" in sys.argv:
+        sys.exit(batch_main(sys.argv[sys.argv.index("--") + 1:]))
     register()
\ No newline at end of file
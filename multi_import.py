@@ -3,22 +3,58 @@ bl_info = {
     "description": "Imports multiple 3D file formats with customizable post-processing",
     "author": "Mox Alehin",
     "blender": (2, 80, 0),
-    "version": (1, 2),
+    "version": (1, 14),
     "category": "Import-Export",
     "location": "File > Import",
 }
 
 import bpy
+import bmesh
+import numpy as np
 from bpy_extras.io_utils import ImportHelper
-from bpy.types import Operator, AddonPreferences
-from bpy.props import StringProperty, BoolProperty
+from bpy.types import Operator, AddonPreferences, OperatorFileListElement
+from bpy.props import StringProperty, BoolProperty, IntProperty, FloatProperty, CollectionProperty
 import zipfile
+import mmap
+import math
+import hashlib
 import os
+import sys
+import json
+import time
 import tempfile
 import shutil
-from mathutils import Vector
+import subprocess
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+MODEL_EXTENSIONS = {'fbx', 'obj', 'stl', 'abc', 'usd', 'usdz', 'blend', 'zip', 'dae', 'glb', 'gltf'}
+TEXTURE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'tga', 'bmp'}
+SIDECAR_EXTENSIONS = {'mtl', 'bin'}
+TEXTURE_REFERENCE = re.compile(rb'[\w\-. ]+\.(?:png|jpe?g|tga|bmp)', re.IGNORECASE)
+MAX_ZIP_DEPTH = 4
+
+_cache_stats = {"hits": 0, "misses": 0}
+_dedupe_stats = {"meshes": 0, "bytes": 0}
+_watch_state = {"directory": "", "seen": {}, "imported": {}, "queue": []}
+
+POST_PROCESS_OPTIONS = (
+    "clear_parent", "remove_non_mesh", "join_meshes", "rename_object", "remove_materials",
+    "center_origin", "scale_to_unit", "shade_flat", "clean_geometry", "clear_seams_sharps",
+    "clear_split_normals", "manage_uv_maps", "deduplicate_meshes", "generate_lods", "lod_ratios", "purge_orphans",
+)
+IMPORT_OPTIONS = POST_PROCESS_OPTIONS + ("zip_max_size_mb", "zip_max_ratio", "fast_mesh_readers")
+# Mesh attributes join_mesh_objects() carries over besides UV maps
+JOINED_ATTRIBUTES = {"position", "material_index", "sharp_face", "sharp_edge", "uv_seam"}
+STL_TRIANGLE = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+ID_COLLECTIONS = (
+    "actions", "armatures", "cameras", "collections", "curves", "fonts", "grease_pencils", "images",
+    "lattices", "lightprobes", "lights", "linestyles", "masks", "materials", "meshes", "metaballs",
+    "movieclips", "node_groups", "objects", "paint_curves", "palettes", "particles", "pointclouds",
+    "sounds", "speakers", "texts", "textures", "volumes", "worlds", "hair_curves", "cache_files",
+)
+
 class MultiImporterPreferences(AddonPreferences):
     bl_idname = __name__
 
@@ -82,11 +118,84 @@ class MultiImporterPreferences(AddonPreferences):
         description="Keep only the first UV map and rename it to 'UVMap'",
         default=True,
     )
+    deduplicate_meshes: BoolProperty(
+        name="Share Identical Meshes",
+        description="Link objects whose mesh matches one already in the file to that mesh instead of keeping a copy",
+        default=False,
+    )
+    generate_lods: BoolProperty(
+        name="Generate LODs",
+        description="Create decimated levels of detail and display the lightest one",
+        default=False,
+    )
+    lod_ratios: StringProperty(
+        name="LOD Ratios",
+        description="Comma-separated triangle budgets of the levels of detail, as fractions of the full mesh",
+        default="0.25, 0.05",
+    )
     purge_orphans: BoolProperty(
         name="Purge Unused Data",
         description="Purge unused data blocks after import",
         default=True,
     )
+    zip_max_size_mb: IntProperty(
+        name="ZIP Extraction Limit (MB)",
+        description="Stop extracting an archive once this much data has been written",
+        default=8192,
+        min=1,
+    )
+    zip_max_ratio: IntProperty(
+        name="ZIP Compression Ratio Limit",
+        description="Skip archive members that claim to expand more than this many times",
+        default=200,
+        min=1,
+    )
+    fast_mesh_readers: BoolProperty(
+        name="Fast STL/OBJ Readers",
+        description="Read STL and OBJ files directly into a single mesh, skipping materials, normals and object splits",
+        default=False,
+    )
+    use_import_cache: BoolProperty(
+        name="Cache Imports",
+        description="Reuse the processed result when the same file is imported again with the same options",
+        default=True,
+    )
+    cache_directory: StringProperty(
+        name="Cache Directory",
+        description="Where processed imports are cached (empty = system temporary directory)",
+        subtype='DIR_PATH',
+        default="",
+    )
+    cache_size_mb: IntProperty(
+        name="Cache Size (MB)",
+        description="Least recently used entries are removed when the cache grows beyond this size",
+        default=2048,
+        min=1,
+    )
+    worker_count: IntProperty(
+        name="Import Workers",
+        description="Background Blender processes used when importing several files (0 = one per CPU core, 1 = import in this session)",
+        default=0,
+        min=0,
+    )
+    watch_directory: StringProperty(
+        name="Watch Directory",
+        description="Directory whose new or changed files are imported automatically while watching",
+        subtype='DIR_PATH',
+        default="",
+    )
+    watch_interval: FloatProperty(
+        name="Watch Interval (s)",
+        description="Time between two checks of the watch directory",
+        default=2.0,
+        min=0.5,
+    )
+    watch_files_per_tick: IntProperty(
+        name="Files per Check",
+        description="Most files imported per check of the watch directory, the rest wait for the next one",
+        default=1,
+        min=1,
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -103,216 +212,1178 @@ class MultiImporterPreferences(AddonPreferences):
         layout.prop(self, "clear_seams_sharps")
         layout.prop(self, "clear_split_normals")
         layout.prop(self, "manage_uv_maps")
+        layout.prop(self, "deduplicate_meshes")
+        layout.prop(self, "generate_lods")
+        if self.generate_lods:
+            layout.prop(self, "lod_ratios")
         layout.prop(self, "purge_orphans")
+        layout.separator()
+        layout.prop(self, "zip_max_size_mb")
+        layout.prop(self, "zip_max_ratio")
+        layout.prop(self, "fast_mesh_readers")
+        layout.prop(self, "worker_count")
+        layout.separator()
+        layout.prop(self, "use_import_cache")
+        if self.use_import_cache:
+            layout.prop(self, "cache_directory")
+            layout.prop(self, "cache_size_mb")
+            layout.label(text=f"Cache this session: {_cache_stats['hits']} hits, {_cache_stats['misses']} misses")
+        layout.separator()
+        layout.prop(self, "watch_directory")
+        layout.prop(self, "watch_interval")
+        layout.prop(self, "watch_files_per_tick")
+        watching = bpy.app.timers.is_registered(watch_tick)
+        layout.operator(WatchDirectoryOperator.bl_idname, text="Stop Watching" if watching else "Start Watching")
 
-class ImportAllOperator(Operator, ImportHelper):
-    bl_idname = "import_scene.multi_importer"
-    bl_label = "Import Multi Format"
+def to_upper_camel_case(name):
+    # Replace any non-alphanumeric characters with spaces
+    name = re.sub(r'[^A-Za-z0-9]+', ' ', name)
+    # Split the string into words
+    words = name.strip().split()
+    # Capitalize each word and join them
+    return ''.join(word.capitalize() for word in words)
 
-    filter_glob: StringProperty(
-        default="*.fbx;*.obj;*.stl;*.abc;*.usd;*.usdz;*.blend;*.zip;*.dae;*.glb;*.gltf",
-        options={'HIDDEN'},
-    )
+def import_file(filepath, file_extension, report, addon_prefs):
+    if file_extension == 'fbx':
+        bpy.ops.import_scene.fbx(filepath=filepath)
+    elif (file_extension in ('obj', 'stl') and getattr(addon_prefs, "fast_mesh_readers", False)
+          and import_mesh_fast(filepath, file_extension, report) is not None):
+        pass
+    elif file_extension == 'obj':
+        bpy.ops.wm.obj_import(filepath=filepath)
+    elif file_extension == 'stl':
+        bpy.ops.import_mesh.stl(filepath=filepath)
+    elif file_extension == 'abc':
+        bpy.ops.wm.alembic_import(filepath=filepath)
+    elif file_extension == 'usd' or file_extension == 'usdz':
+        bpy.ops.wm.usd_import(filepath=filepath)
+    elif file_extension in ['glb', 'gltf']:
+        bpy.ops.import_scene.gltf(filepath=filepath)
+    elif file_extension == 'blend':
+        # Using append to add data from the .blend file
+        with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+            data_to.objects = data_from.objects
+        for obj in data_to.objects:
+            if obj is not None:
+                bpy.context.collection.objects.link(obj)
+    elif file_extension == 'dae':
+        bpy.ops.wm.collada_import(filepath=filepath)
+    elif file_extension == 'zip':
+        import_from_zip(filepath, report, addon_prefs)
+    elif file_extension in ['png', 'jpg', 'jpeg', 'tga', 'bmp']:
+        import_textures([filepath], report)
+    else:
+        report({'ERROR'}, f"Unsupported file format: {file_extension}")
+        return {'CANCELLED'}
 
-    def execute(self, context):
-        # Get addon preferences
-        addon_prefs = context.preferences.addons[__name__].preferences
+def merge_vertices(corners):
+    """Merge bit-identical vertex positions. Returns the unique positions and an index per corner."""
+    # Adding zero turns -0.0 into 0.0 so both hash alike
+    corners = np.ascontiguousarray(corners + np.float32(0.0), dtype=np.float32)
+    keys = corners.view(np.dtype((np.void, corners.dtype.itemsize * 3))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return corners[first], inverse.ravel()
 
-        # Save existing objects before import
-        existing_objects = set(bpy.data.objects.keys())
+def read_stl(filepath):
+    """Read a binary or ASCII STL file. Returns merged vertex positions and a triangle index array."""
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as file:
+        header = file.read(84)
+    count = int.from_bytes(header[80:84], 'little') if len(header) == 84 else -1
+    if size == 84 + count * STL_TRIANGLE.itemsize:
+        triangles = np.memmap(filepath, dtype=STL_TRIANGLE, mode='r', offset=84, shape=(count,))
+        corners = np.array(triangles['vertices']).reshape(-1, 3)
+    else:
+        with open(filepath, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            values = re.findall(rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)', data)
+        corners = np.array(values, dtype=np.bytes_).astype(np.float32).reshape(-1, 3)
+    coords, inverse = merge_vertices(corners)
+    return coords, inverse.reshape(-1, 3)
 
-        # Determine file extension and call appropriate import function
-        filepath = self.filepath
-        file_extension = filepath.split('.')[-1].lower()
+def parse_obj_table(lines, columns):
+    """Parse the leading numeric columns of OBJ lines that share a keyword into a float32 array."""
+    if not lines:
+        return np.empty((0, columns), dtype=np.float32)
+    tokens = b' '.join(lines).split()
+    width = len(lines[0].split())
+    if width > columns and len(tokens) == width * len(lines):
+        table = np.array(tokens, dtype=np.bytes_).reshape(-1, width)[:, 1:columns + 1]
+    else:
+        # Lines have differing lengths, e.g. optional weights or vertex colors
+        table = np.array([line.split()[1:columns + 1] for line in lines], dtype=np.bytes_)
+    return table.astype(np.float32).reshape(-1, columns)
 
-        # Get filename without extension
-        filename = os.path.basename(self.filepath)
-        object_name_raw = os.path.splitext(filename)[0]
+def parse_obj_indices(tokens, lines, keyword, face_sizes):
+    """Turn 1-based OBJ indices into 0-based ones, resolving negative indices against the elements defined before each face."""
+    indices = tokens.astype(np.int64)
+    negative = indices < 0
+    if not negative.any():
+        return indices - 1
+    counts = []
+    seen = 0
+    for line in lines:
+        if line.startswith(keyword):
+            seen += 1
+        elif line.startswith(b'f '):
+            counts.append(seen)
+    counts = np.repeat(counts, face_sizes)
+    return np.where(negative, indices + counts, indices - 1)
 
-        # Convert name to Upper Camel Case
-        object_name = self.to_upper_camel_case(object_name_raw)
+def check_indices(indices, count, element):
+    """Reject indices outside 0..count-1, which would corrupt the mesh instead of failing."""
+    if len(indices) and (indices.min() < 0 or indices.max() >= count):
+        raise ValueError(f"{element} index out of range")
 
-        self.import_file(filepath, file_extension)
+def drop_degenerate_faces(loop_starts, loop_vertices, uvs):
+    """Skip faces that use a vertex more than once, like merged STL triangles with repeated corners, as the stock importers do.
+    Returns the loop starts, loop vertices and UVs of the remaining faces."""
+    face_sizes = np.diff(np.append(loop_starts, len(loop_vertices)))
+    face_ids = np.repeat(np.arange(len(loop_starts)), face_sizes)
+    order = np.lexsort((loop_vertices, face_ids))
+    sorted_vertices = loop_vertices[order]
+    sorted_faces = face_ids[order]
+    repeated = (sorted_vertices[1:] == sorted_vertices[:-1]) & (sorted_faces[1:] == sorted_faces[:-1])
+    if not repeated.any():
+        return loop_starts, loop_vertices, uvs
+    keep_faces = np.ones(len(loop_starts), dtype=bool)
+    keep_faces[sorted_faces[1:][repeated]] = False
+    keep_loops = keep_faces[face_ids]
+    face_sizes = face_sizes[keep_faces]
+    if not len(face_sizes):
+        raise ValueError("no valid faces found")
+    loop_starts = np.cumsum(face_sizes) - face_sizes
+    return loop_starts, loop_vertices[keep_loops], None if uvs is None else uvs[keep_loops]
 
-        # Get list of imported objects
-        imported_objects = [obj for obj in bpy.data.objects if obj.name not in existing_objects]
+def read_obj(filepath):
+    """Read vertices, faces and texture coordinates of an OBJ file.
+    Returns positions, polygon loop starts, loop vertex indices and per-loop UVs (or None)."""
+    with open(filepath, 'rb') as file:
+        data = file.read()
+    # Keywords may be followed by any whitespace, and lines may end in a comment
+    data = data.replace(b'\t', b' ')
+    lines = data.splitlines()
+    if b'#' in data:
+        lines = [line.partition(b'#')[0] for line in lines]
+    if data.startswith(b' ') or b'\n ' in data:
+        lines = [line.lstrip() for line in lines]
+    vertex_lines = []
+    uv_lines = []
+    face_lines = []
+    for line in lines:
+        keyword = line[:2]
+        if keyword == b'v ':
+            vertex_lines.append(line)
+        elif keyword == b'vt':
+            uv_lines.append(line)
+        elif keyword == b'f ':
+            face_lines.append(line)
 
-        # Perform post-processing based on preferences
-        self.post_process(imported_objects, object_name, addon_prefs)
+    if not face_lines:
+        raise ValueError("no faces found")
+    coords = parse_obj_table(vertex_lines, 3)
+    tokens = np.array(b' '.join(face_lines).split(), dtype=np.bytes_)
+    is_keyword = tokens == b'f'
+    face_sizes = np.diff(np.append(np.flatnonzero(is_keyword), len(tokens))) - 1
+    if face_sizes.min() < 3:
+        raise ValueError("face with fewer than 3 vertices")
+    loop_starts = np.cumsum(face_sizes) - face_sizes
 
-        return {'FINISHED'}
+    # Corners are "v", "v/vt", "v//vn" or "v/vt/vn"
+    vertex_tokens, _, rest = np.char.partition(tokens[~is_keyword], b'/').T
+    loop_vertices = parse_obj_indices(vertex_tokens, lines, b'v ', face_sizes)
+    check_indices(loop_vertices, len(coords), "vertex")
+    uvs = None
+    uv_tokens = np.char.partition(rest, b'/')[:, 0]
+    if uv_lines and len(uv_tokens) and (uv_tokens != b'').all():
+        uv_table = parse_obj_table(uv_lines, 2)
+        uv_indices = parse_obj_indices(uv_tokens, lines, b'vt', face_sizes)
+        check_indices(uv_indices, len(uv_table), "texture coordinate")
+        uvs = uv_table[uv_indices]
+    return coords, loop_starts, loop_vertices, uvs
 
-    def to_upper_camel_case(self, name):
-        # Replace any non-alphanumeric characters with spaces
-        name = re.sub(r'[^A-Za-z0-9]+', ' ', name)
-        # Split the string into words
-        words = name.strip().split()
-        # Capitalize each word and join them
-        return ''.join(word.capitalize() for word in words)
-
-    def import_file(self, filepath, file_extension):
-        if file_extension == 'fbx':
-            bpy.ops.import_scene.fbx(filepath=filepath)
-        elif file_extension == 'obj':
-            bpy.ops.wm.obj_import(filepath=filepath)
-        elif file_extension == 'stl':
-            bpy.ops.import_mesh.stl(filepath=filepath)
-        elif file_extension == 'abc':
-            bpy.ops.wm.alembic_import(filepath=filepath)
-        elif file_extension == 'usd' or file_extension == 'usdz':
-            bpy.ops.wm.usd_import(filepath=filepath)
-        elif file_extension in ['glb', 'gltf']:
-            bpy.ops.import_scene.gltf(filepath=filepath)
-        elif file_extension == 'blend':
-            # Using append to add data from the .blend file
-            with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
-                data_to.objects = data_from.objects
-            for obj in data_to.objects:
-                if obj is not None:
-                    bpy.context.collection.objects.link(obj)
-        elif file_extension == 'dae':
-            bpy.ops.wm.collada_import(filepath=filepath)
-        elif file_extension == 'zip':
-            self.import_from_zip(filepath)
-        elif file_extension in ['png', 'jpg', 'jpeg', 'tga', 'bmp']:
-            self.import_texture(filepath)
+def import_mesh_fast(filepath, file_extension, report):
+    """Import an STL or OBJ file as a single mesh object without going through the stock importers.
+    Returns the object, or None if the file could not be read so the stock importer can take over."""
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    try:
+        if file_extension == 'stl':
+            coords, triangles = read_stl(filepath)
+            loop_starts = np.arange(0, triangles.size, 3)
+            loop_vertices = triangles.ravel()
+            uvs = None
         else:
-            self.report({'ERROR'}, f"Unsupported file format: {file_extension}")
-            return {'CANCELLED'}
+            coords, loop_starts, loop_vertices, uvs = read_obj(filepath)
+            # OBJ is Y-up, like the stock importer convert it to Z-up
+            coords = coords[:, [0, 2, 1]] * np.array((1.0, -1.0, 1.0), dtype=np.float32)
+        check_indices(loop_vertices, len(coords), "vertex")
+        loop_starts, loop_vertices, uvs = drop_degenerate_faces(loop_starts, loop_vertices, uvs)
+    except (ValueError, IndexError, OSError) as e:
+        report({'WARNING'}, f"Fast reader failed on {os.path.basename(filepath)} ({e}), using the stock importer")
+        return None
+    mesh = create_mesh_from_arrays(name, coords, loop_starts, loop_vertices)
+    if uvs is not None:
+        mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uvs.ravel())
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+def extract_member(zip_ref, info, target_dir, budget):
+    """Stream one archive member to disk. Returns the path and the bytes written, never more than its declared size or the budget."""
+    target_path = os.path.normpath(os.path.join(target_dir, info.filename))
+    if not target_path.startswith(os.path.normpath(target_dir) + os.sep):
+        raise ValueError(f"Unsafe path in archive: {info.filename}")
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    written = 0
+    with zip_ref.open(info) as source, open(target_path, 'wb') as target:
+        while True:
+            chunk = source.read(1 << 20)
+            if not chunk:
+                break
+            written += len(chunk)
+            if written > info.file_size or written > budget:
+                raise ValueError(f"Archive member exceeds its size limit: {info.filename}")
+            target.write(chunk)
+    return target_path, written
+
+def open_nested_archive(zip_ref, info, limits):
+    """Seekable file for a nested archive. Stored members are read in place, compressed ones are first
+    decompressed once into a spooled temporary file counted against the extraction budget, since every
+    backward seek in a compressed member restarts decompression."""
+    if info.compress_type == zipfile.ZIP_STORED:
+        return zip_ref.open(info)
+    spool = tempfile.SpooledTemporaryFile(max_size=64 << 20)
+    written = 0
+    with zip_ref.open(info) as source:
+        while True:
+            chunk = source.read(1 << 20)
+            if not chunk:
+                break
+            written += len(chunk)
+            if written > info.file_size or written > limits.remaining:
+                spool.close()
+                raise ValueError(f"Archive member exceeds its size limit: {info.filename}")
+            spool.write(chunk)
+    limits.remaining -= written
+    spool.seek(0)
+    return spool
+
+def find_texture_references(paths):
+    """Lowercase texture file names mentioned in model and sidecar files."""
+    references = set()
+    for path in paths:
+        if not os.path.getsize(path):
+            continue
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for match in TEXTURE_REFERENCE.findall(data):
+                words = match.decode('utf-8', 'ignore').lower().split(' ')
+                # Names may contain spaces, so every tail of the match is a candidate
+                references.update(' '.join(words[i:]) for i in range(len(words)))
+    return references
+
+def extract_zip_selection(zip_ref, target_dir, limits, report, depth=0):
+    """Extract only the members import_file can handle, their sidecar files and the textures they reference,
+    reading the central directory first and recursing into nested archives.
+    Returns (model paths, texture paths)."""
+    models, sidecars, textures, nested = [], [], [], []
+    for info in zip_ref.infolist():
+        if info.is_dir():
+            continue
+        if os.path.isabs(info.filename) or '..' in info.filename.replace('\\', '/').split('/'):
+            report({'WARNING'}, f"Skipped {info.filename}: unsafe path")
+            continue
+        file_extension = info.filename.split('.')[-1].lower()
+        if info.compress_size and info.file_size / info.compress_size > limits.max_ratio:
+            report({'WARNING'}, f"Skipped {info.filename}: compression ratio above {limits.max_ratio}")
+            continue
+        if file_extension == 'zip':
+            nested.append(info)
+        elif file_extension in MODEL_EXTENSIONS:
+            models.append(info)
+        elif file_extension in SIDECAR_EXTENSIONS:
+            sidecars.append(info)
+        elif file_extension in TEXTURE_EXTENSIONS:
+            textures.append(info)
+
+    def extract(info):
+        if info.file_size > limits.remaining:
+            raise ValueError(f"Extraction limit reached at {info.filename}")
+        path, written = extract_member(zip_ref, info, target_dir, limits.remaining)
+        limits.remaining -= written
+        return path
+
+    model_paths = [extract(info) for info in models]
+    sidecar_paths = [extract(info) for info in sidecars]
+    texture_paths = []
 
-    def import_from_zip(self, filepath, temp_dir=None):
-        if temp_dir is None:
-            temp_dir = tempfile.mkdtemp()
+    for index, info in enumerate(nested):
+        if depth >= MAX_ZIP_DEPTH:
+            report({'WARNING'}, f"Skipped {info.filename}: archives nested too deeply")
+            continue
+        with open_nested_archive(zip_ref, info, limits) as nested_file, zipfile.ZipFile(nested_file) as nested_zip:
+            nested_models, nested_textures = extract_zip_selection(
+                nested_zip, os.path.join(target_dir, f"nested_{depth}_{index}"), limits, report, depth + 1)
+        model_paths.extend(nested_models)
+        texture_paths.extend(nested_textures)
 
+    if models:
+        references = find_texture_references(model_paths[:len(models)] + sidecar_paths)
+        textures = [info for info in textures if os.path.basename(info.filename).lower() in references]
+    texture_paths.extend(extract(info) for info in textures)
+    return model_paths, texture_paths
+
+def import_from_zip(filepath, report, addon_prefs, temp_dir=None):
+    if temp_dir is None:
+        temp_dir = tempfile.mkdtemp()
+
+    limits = SimpleNamespace(remaining=addon_prefs.zip_max_size_mb * 1024 * 1024, max_ratio=addon_prefs.zip_max_ratio)
+    try:
         with zipfile.ZipFile(filepath, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-
-        for root, _, files in os.walk(temp_dir):
-            for file in files:
-                full_path = os.path.join(root, file)
-                file_extension = file.split('.')[-1].lower()
-                self.import_file(full_path, file_extension)
-
-        if temp_dir:
-            # Clean up the temporary directory only if it was created in this function call
-            shutil.rmtree(temp_dir)
-
-    def import_texture(self, filepath):
-        texture_name = os.path.basename(filepath)
-        if texture_name in bpy.data.images:
-            img = bpy.data.images[texture_name]
-            img.filepath = filepath
-            img.reload()
+            model_paths, texture_paths = extract_zip_selection(zip_ref, temp_dir, limits, report)
+
+        for full_path in model_paths:
+            file_extension = full_path.split('.')[-1].lower()
+            import_file(full_path, file_extension, report, addon_prefs)
+        if texture_paths:
+            import_textures(texture_paths, report)
+    except (ValueError, zipfile.BadZipFile) as e:
+        report({'ERROR'}, f"Failed to import {os.path.basename(filepath)}: {e}")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def import_texture(filepath, digest):
+    """Load and pack a texture, reusing the image of the same name only if it holds no other packed content."""
+    img = bpy.data.images.get(os.path.basename(filepath))
+    if img is not None and img.get("content_hash") in (None, digest):
+        img.filepath = filepath
+        img.reload()
+    else:
+        img = bpy.data.images.load(filepath)
+    img.pack()  # Pack the image into the .blend file
+    img["content_hash"] = digest
+    return img
+
+def import_textures(filepaths, report):
+    """Load and pack textures, packing each distinct file content once and remapping duplicates onto that image."""
+    with ThreadPoolExecutor() as executor:
+        digests = list(executor.map(hash_file, filepaths))
+    packed = {img["content_hash"]: img for img in bpy.data.images if img.packed_file and "content_hash" in img}
+    duplicates = 0
+    saved = 0
+    for filepath, digest in zip(filepaths, digests):
+        canonical = packed.get(digest)
+        if canonical is None:
+            packed[digest] = import_texture(filepath, digest)
+            continue
+        duplicates += 1
+        saved += os.path.getsize(filepath)
+        # An importer may already have created an image for this file, point its users at the packed copy
+        img = bpy.data.images.get(os.path.basename(filepath))
+        if img is not None and img != canonical and "content_hash" not in img:
+            img.user_remap(canonical)
+            bpy.data.images.remove(img)
+    if duplicates:
+        report({'INFO'}, f"Reused {duplicates} duplicate texture(s), saving {saved / (1024 * 1024):.1f} MB of packed data")
+
+def center_and_scale_mesh(obj, center_origin, scale_to_unit, unit_scale):
+    """Move the origin to the bottom center of the world bounding box and clear the location,
+    and/or bake a scale that fits the model in a 1-meter cube, in one read and write of the vertex coordinates."""
+    mesh = obj.data
+    count = len(mesh.vertices)
+    if not count:
+        return
+    coords = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(count, 3).astype(np.float64)
+
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    linear = matrix[:3, :3]
+    translation = matrix[:3, 3]
+    low = coords.min(axis=0)
+    high = coords.max(axis=0)
+    corners = np.array([(x, y, z) for x in (low[0], high[0]) for y in (low[1], high[1]) for z in (low[2], high[2])])
+    bbox = corners @ linear.T + translation
+
+    offset = np.zeros(3)
+    if center_origin:
+        pivot = np.array((bbox[:, 0].mean(), bbox[:, 1].mean(), bbox[:, 2].min()))
+        # The pivot in local space becomes the new origin
+        offset = np.linalg.solve(linear, pivot - translation)
+        obj.location = (0.0, 0.0, 0.0)
+
+    scale = np.ones(3)
+    if scale_to_unit:
+        max_dimension = (bbox.max(axis=0) - bbox.min(axis=0)).max()
+        if max_dimension > 0:
+            scale = np.array(obj.scale) * (1.0 / unit_scale) / max_dimension
+            obj.scale = (1.0, 1.0, 1.0)
+
+    mesh.vertices.foreach_set("co", ((coords - offset) * scale).astype(np.float32).ravel())
+    mesh.update()
+
+def create_mesh_from_arrays(name, coords, loop_starts, loop_vertices, edges=None):
+    """Create a mesh from vertex coordinates, polygon loop starts and loop vertex indices."""
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32).ravel())
+    if edges is not None and len(edges):
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set("vertices", np.ascontiguousarray(edges, dtype=np.int32).ravel())
+    mesh.loops.add(len(loop_vertices))
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loop_vertices, dtype=np.int32))
+    mesh.polygons.add(len(loop_starts))
+    mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(loop_starts, dtype=np.int32))
+    try:
+        loop_totals = np.diff(np.append(loop_starts, len(loop_vertices))).astype(np.int32)
+        mesh.polygons.foreach_set("loop_total", loop_totals)
+    except (AttributeError, TypeError, RuntimeError):
+        # Read-only since Blender 4.0, where it is derived from loop_start
+        pass
+    mesh.update(calc_edges=True)
+    return mesh
+
+def edge_keys(edges, vertex_count):
+    """One integer per edge that does not depend on the order of its two vertices."""
+    edges = np.sort(np.asarray(edges, dtype=np.int64).reshape(-1, 2), axis=1)
+    return edges[:, 0] * vertex_count + edges[:, 1]
+
+def map_edge_flags(mesh, edges, flags):
+    """Carry a flag per edge of edges over to the matching edges of mesh, whose edge order may differ."""
+    mesh_edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", mesh_edges)
+    vertex_count = len(mesh.vertices)
+    return np.isin(edge_keys(mesh_edges, vertex_count), edge_keys(edges, vertex_count)[flags])
+
+def needs_join_operator(mesh_objects, keep_custom_normals):
+    """Whether any part carries data that only bpy.ops.object.join() merges: shape keys, vertex groups,
+    custom normals that are kept, edge creases, color or other generic attributes."""
+    edge_crease = "crease" in bpy.types.MeshEdge.bl_rna.properties
+    for obj in mesh_objects:
+        mesh = obj.data
+        if mesh.shape_keys or obj.vertex_groups:
+            return True
+        if keep_custom_normals and mesh.has_custom_normals:
+            return True
+        copied = JOINED_ATTRIBUTES | {layer.name for layer in mesh.uv_layers}
+        if not keep_custom_normals:
+            copied = copied | {"custom_normal"}
+        for attribute in getattr(mesh, "attributes", ()):
+            # Names starting with a dot are Blender's internal selection, visibility and UV flags
+            if not attribute.name.startswith(".") and attribute.name not in copied:
+                return True
+        if edge_crease and mesh.edges:
+            creases = np.empty(len(mesh.edges), dtype=np.float32)
+            mesh.edges.foreach_get("crease", creases)
+            if creases.any():
+                return True
+    return False
+
+def join_mesh_objects(active_obj, mesh_objects):
+    """Join mesh objects into active_obj by concatenating their data arrays, with each part's transform baked relative to active_obj."""
+    to_active = np.array(active_obj.matrix_world.inverted(), dtype=np.float64)
+    material_index = {}
+    uv_names = []
+    parts = []
+    vertex_offset = loop_offset = 0
+    for obj in mesh_objects:
+        mesh = obj.data
+        vertex_count, edge_count = len(mesh.vertices), len(mesh.edges)
+        loop_count, polygon_count = len(mesh.loops), len(mesh.polygons)
+
+        coords = np.empty(vertex_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        matrix = to_active @ np.array(obj.matrix_world, dtype=np.float64)
+        coords = coords.reshape(vertex_count, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+        edges = np.empty(edge_count * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        loop_vertices = np.empty(loop_count, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vertices)
+        loop_starts = np.empty(polygon_count, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        material_indices = np.empty(polygon_count, dtype=np.int32)
+        mesh.polygons.foreach_get("material_index", material_indices)
+        smooth = np.empty(polygon_count, dtype=bool)
+        mesh.polygons.foreach_get("use_smooth", smooth)
+        seams = np.empty(edge_count, dtype=bool)
+        mesh.edges.foreach_get("use_seam", seams)
+        sharps = np.empty(edge_count, dtype=bool)
+        mesh.edges.foreach_get("use_edge_sharp", sharps)
+
+        # Map the object's material slots onto the joined slot list
+        slots = [slot.material for slot in obj.material_slots]
+        remap = np.array([material_index.setdefault(material, len(material_index)) for material in slots] or [0], dtype=np.int32)
+        material_indices = remap[np.clip(material_indices, 0, len(remap) - 1)]
+
+        uvs = {}
+        for layer in mesh.uv_layers:
+            uv = np.empty(loop_count * 2, dtype=np.float32)
+            layer.data.foreach_get("uv", uv)
+            uvs[layer.name] = uv
+            if layer.name not in uv_names:
+                uv_names.append(layer.name)
+
+        parts.append(SimpleNamespace(
+            coords=coords, edges=edges.reshape(edge_count, 2) + vertex_offset,
+            loop_vertices=loop_vertices + vertex_offset, loop_starts=loop_starts + loop_offset,
+            material_indices=material_indices, smooth=smooth, seams=seams, sharps=sharps, uvs=uvs, loop_count=loop_count,
+        ))
+        vertex_offset += vertex_count
+        loop_offset += loop_count
+
+    name = active_obj.data.name
+    mesh = create_mesh_from_arrays(
+        name,
+        np.concatenate([part.coords for part in parts]),
+        np.concatenate([part.loop_starts for part in parts]),
+        np.concatenate([part.loop_vertices for part in parts]),
+        np.concatenate([part.edges for part in parts]),
+    )
+    for material in material_index:
+        mesh.materials.append(material)
+    mesh.polygons.foreach_set("material_index", np.concatenate([part.material_indices for part in parts]))
+    mesh.polygons.foreach_set("use_smooth", np.concatenate([part.smooth for part in parts]))
+    # Computing the missing edges can reorder the given ones, so match the flags by vertex pair
+    edges = np.concatenate([part.edges for part in parts])
+    mesh.edges.foreach_set("use_seam", map_edge_flags(mesh, edges, np.concatenate([part.seams for part in parts])))
+    mesh.edges.foreach_set("use_edge_sharp", map_edge_flags(mesh, edges, np.concatenate([part.sharps for part in parts])))
+    for uv_name in uv_names:
+        layer = mesh.uv_layers.new(name=uv_name)
+        if layer is None:
+            # Blender's UV map limit has been reached
+            break
+        uv = np.concatenate([part.uvs.get(uv_name, np.zeros(part.loop_count * 2, dtype=np.float32)) for part in parts])
+        layer.data.foreach_set("uv", uv)
+
+    old_meshes = {obj.data for obj in mesh_objects}
+    active_obj.data = mesh
+    for obj in mesh_objects:
+        if obj is not active_obj:
+            bpy.data.objects.remove(obj, do_unlink=True)
+    for old_mesh in old_meshes:
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+    mesh.name = name
+
+def snapshot_ids():
+    """Pointers of every datablock currently in the file, per bpy.data collection."""
+    return {
+        name: {id_block.as_pointer() for id_block in getattr(bpy.data, name)}
+        for name in ID_COLLECTIONS if hasattr(bpy.data, name)
+    }
+
+def get_created_ids(snapshot):
+    """Datablocks that were not in the file when the snapshot was taken, per bpy.data collection."""
+    return {
+        name: [id_block for id_block in getattr(bpy.data, name) if id_block.as_pointer() not in existing]
+        for name, existing in snapshot.items()
+    }
+
+def purge_created_ids(snapshot):
+    """Remove the unused datablocks created since the snapshot, repeating while removals leave more of them unused.
+    Returns the number of datablocks removed."""
+    candidates = [id_block for ids in get_created_ids(snapshot).values() for id_block in ids]
+    removed = 0
+    while candidates:
+        unused = []
+        remaining = []
+        for id_block in candidates:
+            try:
+                if id_block.users == 0:
+                    unused.append(id_block)
+                else:
+                    remaining.append(id_block)
+            except ReferenceError:
+                # Already freed along with its owner
+                continue
+        if not unused:
+            break
+        bpy.data.batch_remove(unused)
+        removed += len(unused)
+        candidates = remaining
+    return removed
+
+def estimate_mesh_bytes(mesh):
+    """Rough in-memory size of a mesh's core geometry and UV maps."""
+    loops = len(mesh.loops)
+    return (len(mesh.vertices) * 12 + len(mesh.edges) * 8 + loops * 8 + len(mesh.polygons) * 12
+            + len(mesh.uv_layers) * loops * 8)
+
+def count_triangles(mesh):
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int((loop_totals - 2).sum())
+
+def mesh_fingerprint(mesh):
+    """Digest of a mesh's element counts, quantized coordinates and UVs, topology, smoothing and materials."""
+    vertex_count, loop_count, polygon_count = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+    digest = hashlib.sha256(repr((vertex_count, len(mesh.edges), loop_count, polygon_count)).encode())
+    coords = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    # Quantize to 10 micrometers so float noise from different exporters does not break matches
+    digest.update(np.round(coords * 1e5).astype(np.int64).tobytes())
+    for collection, attribute, dtype, size in (
+        (mesh.edges, "vertices", np.int32, 2), (mesh.loops, "vertex_index", np.int32, 1),
+        (mesh.polygons, "loop_start", np.int32, 1), (mesh.polygons, "material_index", np.int32, 1),
+        (mesh.polygons, "use_smooth", bool, 1),
+    ):
+        values = np.empty(len(collection) * size, dtype=dtype)
+        collection.foreach_get(attribute, values)
+        digest.update(values.tobytes())
+    for layer in mesh.uv_layers:
+        uv = np.empty(loop_count * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uv)
+        digest.update(layer.name.encode())
+        digest.update(np.round(uv * 1e5).astype(np.int64).tobytes())
+    # Names without the number Blender appends when a later import brings the same material again
+    digest.update(repr([re.sub(r'\.\d{3}$', '', material.name) if material else None for material in mesh.materials]).encode())
+    return digest.hexdigest()
+
+def deduplicate_meshes(objects):
+    """Link objects whose mesh content matches another mesh in the file to that mesh and remove their copies.
+    Returns the number of meshes removed and their estimated size in bytes."""
+    # Meshes appended from the cache or a worker carry a fingerprint already, they must not match themselves
+    incoming = {obj.data.as_pointer() for obj in objects if obj.type == 'MESH'}
+    known = {
+        mesh["content_fingerprint"]: mesh for mesh in bpy.data.meshes
+        if "content_fingerprint" in mesh and mesh.as_pointer() not in incoming
+    }
+    # Meshes fingerprinted in this call, the others are checked again in case they were edited since
+    verified = set()
+    duplicates = []
+    for obj in objects:
+        if obj.type != 'MESH' or obj.data.shape_keys or "lod_0" in obj:
+            continue
+        mesh = obj.data
+        fingerprint = mesh_fingerprint(mesh)
+        canonical = known.get(fingerprint)
+        if canonical is not None and canonical != mesh and canonical.as_pointer() not in verified:
+            canonical_fingerprint = mesh_fingerprint(canonical)
+            canonical["content_fingerprint"] = canonical_fingerprint
+            verified.add(canonical.as_pointer())
+            if canonical_fingerprint != fingerprint:
+                canonical = None
+        if canonical is None or canonical == mesh:
+            mesh["content_fingerprint"] = fingerprint
+            known[fingerprint] = mesh
+            verified.add(mesh.as_pointer())
+            continue
+        obj.data = canonical
+        if mesh.users == 0:
+            duplicates.append(mesh)
+    saved = sum(estimate_mesh_bytes(mesh) for mesh in duplicates)
+    if duplicates:
+        bpy.data.batch_remove(duplicates)
+    _dedupe_stats["meshes"] += len(duplicates)
+    _dedupe_stats["bytes"] += saved
+    return len(duplicates), saved
+
+def parse_lod_ratios(text):
+    """Fractions between 0 and 1 from a comma-separated list, largest first."""
+    ratios = []
+    for token in re.split(r'[,;\s]+', text.strip()):
+        try:
+            ratio = float(token)
+        except ValueError:
+            continue
+        if 0.0 < ratio < 1.0:
+            ratios.append(ratio)
+    return sorted(set(ratios), reverse=True)
+
+def measure_draw_time(iterations=5):
+    """Average time to redraw the window, or None when there is no window to draw."""
+    if bpy.app.background or bpy.context.window is None:
+        return None
+    start = time.perf_counter()
+    bpy.ops.wm.redraw_timer(type='DRAW_WIN', iterations=iterations)
+    return (time.perf_counter() - start) / iterations
+
+def generate_lods(obj, ratios):
+    """Build a decimated mesh per ratio, keep every level on the object as lod_0 (full detail), lod_1, ...
+    and display the lightest. Returns the meshes, full detail first."""
+    full = obj.data
+    levels = [full]
+    modifier = obj.modifiers.new("LOD", 'DECIMATE')
+    for index, ratio in enumerate(ratios, start=1):
+        modifier.ratio = ratio
+        evaluated = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        mesh = bpy.data.meshes.new_from_object(evaluated)
+        mesh.name = f"{full.name}_LOD{index}"
+        levels.append(mesh)
+    obj.modifiers.remove(modifier)
+    for index, mesh in enumerate(levels):
+        # The ID property is a real user, so hidden levels are saved and appended with the object
+        # and are freed with it instead of lingering as orphans
+        obj[f"lod_{index}"] = mesh
+    obj.data = levels[-1]
+    return levels
+
+def add_timing(timings, stage, stage_start):
+    timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - stage_start
+
+def clean_mesh(mesh, addon_prefs, timings):
+    """Remove doubles, join triangles and clear seams and sharps of a mesh on one bmesh."""
+    stage_start = time.perf_counter()
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    add_timing(timings, "bmesh_from_mesh", stage_start)
+    if addon_prefs.clean_geometry:
+        stage_start = time.perf_counter()
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+        add_timing(timings, "remove_doubles", stage_start)
+        stage_start = time.perf_counter()
+        # The operator used to get 60 for its angle thresholds, which it clamps to 180 degrees
+        bmesh.ops.join_triangles(bm, faces=bm.faces, angle_face_threshold=math.pi, angle_shape_threshold=math.pi)
+        add_timing(timings, "tris_to_quads", stage_start)
+    if addon_prefs.clear_seams_sharps:
+        stage_start = time.perf_counter()
+        for edge in bm.edges:
+            edge.seam = False
+            edge.smooth = True
+        add_timing(timings, "clear_seams_sharps", stage_start)
+    stage_start = time.perf_counter()
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+    add_timing(timings, "bmesh_to_mesh", stage_start)
+
+def post_process(imported_objects, object_name, addon_prefs, snapshot=None):
+    """Apply the enabled post-processing steps. Returns the time spent in each geometry stage.
+    With a snapshot from snapshot_ids(), purging only considers the datablocks created since then."""
+    timings = {}
+
+    # Deselect all objects
+    bpy.ops.object.select_all(action='DESELECT')
+
+    # Separate objects into meshes and non-meshes
+    mesh_objects = []
+    non_mesh_objects = []
+    for obj in imported_objects:
+        if obj.type == 'MESH':
+            mesh_objects.append(obj)
+            obj.select_set(True)
         else:
-            img = bpy.data.images.load(filepath)
-        img.pack()  # Pack the image into the .blend file
-
-    def post_process(self, imported_objects, object_name, addon_prefs):
-        # Deselect all objects
-        bpy.ops.object.select_all(action='DESELECT')
-
-        # Separate objects into meshes and non-meshes
-        mesh_objects = []
-        non_mesh_objects = []
-        for obj in imported_objects:
-            if obj.type == 'MESH':
-                mesh_objects.append(obj)
-                obj.select_set(True)
-            else:
-                non_mesh_objects.append(obj)
+            non_mesh_objects.append(obj)
 
-        # Clear parent while keeping transforms
-        if addon_prefs.clear_parent:
-            for obj in mesh_objects:
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
+    # Clear parent while keeping transforms
+    if addon_prefs.clear_parent:
+        for obj in mesh_objects:
+            matrix = obj.matrix_world.copy()
+            obj.parent = None
+            obj.matrix_world = matrix
 
-        # Remove all non-mesh objects
-        if addon_prefs.remove_non_mesh:
-            for obj in non_mesh_objects:
-                bpy.data.objects.remove(obj, do_unlink=True)
+    # Remove all non-mesh objects
+    if addon_prefs.remove_non_mesh:
+        for obj in non_mesh_objects:
+            bpy.data.objects.remove(obj, do_unlink=True)
 
-        if not mesh_objects:
-            # No imported mesh objects
-            return
+    if not mesh_objects:
+        # No imported mesh objects
+        return timings
 
-        # Set the active object
-        bpy.context.view_layer.objects.active = mesh_objects[0]
+    # Set the active object
+    bpy.context.view_layer.objects.active = mesh_objects[0]
 
-        # Join selected objects into one
-        if addon_prefs.join_meshes and len(mesh_objects) > 1:
+    # Join selected objects into one
+    joined = addon_prefs.join_meshes and len(mesh_objects) > 1
+    if joined:
+        stage_start = time.perf_counter()
+        if needs_join_operator(mesh_objects, not addon_prefs.clear_split_normals):
             bpy.ops.object.join()
             active_obj = bpy.context.view_layer.objects.active
         else:
             active_obj = mesh_objects[0]
+            join_mesh_objects(active_obj, mesh_objects)
+        timings["join"] = time.perf_counter() - stage_start
+    else:
+        active_obj = mesh_objects[0]
+
+    # Rename object and its mesh
+    if addon_prefs.rename_object:
+        active_obj.name = object_name
+        active_obj.data.name = object_name
+
+    # Remove all materials from the object
+    if addon_prefs.remove_materials:
+        active_obj.data.materials.clear()
 
-        # Rename object and its mesh
-        if addon_prefs.rename_object:
-            active_obj.name = object_name
-            active_obj.data.name = object_name
-
-        # Remove all materials from the object
-        if addon_prefs.remove_materials:
-            active_obj.data.materials.clear()
-
-        # Calculate bounding box world coordinates
-        if addon_prefs.center_origin or addon_prefs.scale_to_unit:
-            bbox = [active_obj.matrix_world @ Vector(corner) for corner in active_obj.bound_box]
-
-        # Move origin to center X/Y, bottom Z
-        if addon_prefs.center_origin:
-            center_x = sum([v.x for v in bbox]) / 8.0
-            center_y = sum([v.y for v in bbox]) / 8.0
-            min_z = min(v.z for v in bbox)
-            pivot = Vector((center_x, center_y, min_z))
-            active_obj.location -= pivot
-            bpy.context.view_layer.update()
-            bpy.ops.object.origin_set(type='ORIGIN_CURSOR', center='BOUNDS')
-            active_obj.location += pivot
-            bpy.ops.object.location_clear()
-
-        # Scale the model to fit inside a 1-meter cube
-        if addon_prefs.scale_to_unit:
-            bbox = [active_obj.matrix_world @ Vector(corner) for corner in active_obj.bound_box]
-            min_coord = Vector((min([v[i] for v in bbox]) for i in range(3)))
-            max_coord = Vector((max([v[i] for v in bbox]) for i in range(3)))
-            size = max_coord - min_coord
-            max_dimension = max(size)
-            scene_unit_scale = bpy.context.scene.unit_settings.scale_length
-            target_size = 1.0 / scene_unit_scale
-            scale_factor = target_size / max_dimension
-            active_obj.scale *= scale_factor
-            bpy.ops.object.transform_apply(scale=True)
-
-        # Apply Shade Flat
-        if addon_prefs.shade_flat:
-            bpy.ops.object.shade_flat()
-
-        # Geometry cleanup operations
-        if addon_prefs.clean_geometry or addon_prefs.clear_seams_sharps or addon_prefs.clear_split_normals:
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            if addon_prefs.clean_geometry:
-                bpy.ops.mesh.remove_doubles(threshold=0.0001)
-                bpy.ops.mesh.tris_convert_to_quads(face_threshold=60, shape_threshold=60)
-            if addon_prefs.clear_seams_sharps:
-                bpy.ops.mesh.mark_seam(clear=True)
-                bpy.ops.mesh.mark_sharp(clear=True)
-            if addon_prefs.clear_split_normals:
+    # Move origin to center X/Y, bottom Z and scale the model to fit inside a 1-meter cube
+    if addon_prefs.center_origin or addon_prefs.scale_to_unit:
+        stage_start = time.perf_counter()
+        center_and_scale_mesh(
+            active_obj,
+            addon_prefs.center_origin,
+            addon_prefs.scale_to_unit,
+            bpy.context.scene.unit_settings.scale_length,
+        )
+        timings["center_and_scale"] = time.perf_counter() - stage_start
+
+    # Apply Shade Flat
+    if addon_prefs.shade_flat:
+        bpy.ops.object.shade_flat()
+
+    # Geometry cleanup on in-memory bmeshes, without Edit Mode round trips, on every part when they were not joined
+    cleanup_objects = [active_obj] if joined else mesh_objects
+    if addon_prefs.clean_geometry or addon_prefs.clear_seams_sharps:
+        for mesh in {obj.data for obj in cleanup_objects}:
+            clean_mesh(mesh, addon_prefs, timings)
+
+    if addon_prefs.clear_split_normals:
+        stage_start = time.perf_counter()
+        cleared = set()
+        for obj in cleanup_objects:
+            if obj.data.has_custom_normals and obj.data not in cleared:
+                cleared.add(obj.data)
+                # Works on the mesh data of the active object in Object Mode
+                bpy.context.view_layer.objects.active = obj
                 bpy.ops.mesh.customdata_custom_splitnormals_clear()
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-        # Keep only the first UV map and rename it to "UVMap"
-        if addon_prefs.manage_uv_maps:
-            mesh = active_obj.data
-            if hasattr(mesh, "uv_layers") and len(mesh.uv_layers) > 0:
-                mesh.uv_layers[0].name = "UVMap"
-                while len(mesh.uv_layers) > 1:
-                    mesh.uv_layers.remove(mesh.uv_layers[-1])
-
-        # Purge unused data
-        if addon_prefs.purge_orphans:
+        bpy.context.view_layer.objects.active = active_obj
+        if cleared:
+            timings["clear_split_normals"] = time.perf_counter() - stage_start
+
+    # Keep only the first UV map and rename it to "UVMap"
+    if addon_prefs.manage_uv_maps:
+        mesh = active_obj.data
+        if hasattr(mesh, "uv_layers") and len(mesh.uv_layers) > 0:
+            mesh.uv_layers[0].name = "UVMap"
+            while len(mesh.uv_layers) > 1:
+                mesh.uv_layers.remove(mesh.uv_layers[-1])
+
+    # Share one mesh between objects with identical geometry
+    if addon_prefs.deduplicate_meshes:
+        stage_start = time.perf_counter()
+        deduplicate_meshes([active_obj] if joined else mesh_objects)
+        timings["deduplicate"] = time.perf_counter() - stage_start
+
+    # Create levels of detail and display the lightest
+    ratios = parse_lod_ratios(addon_prefs.lod_ratios) if addon_prefs.generate_lods else []
+    if ratios:
+        stage_start = time.perf_counter()
+        levels = generate_lods(active_obj, ratios)
+        timings["lods"] = time.perf_counter() - stage_start
+        summary = ", ".join(
+            f"LOD{index} {count_triangles(mesh)} tris {estimate_mesh_bytes(mesh) / (1024 * 1024):.1f} MB"
+            for index, mesh in enumerate(levels)
+        )
+        active_obj.data = levels[0]
+        full_draw = measure_draw_time()
+        active_obj.data = levels[-1]
+        if full_draw is not None:
+            summary += f", draw {full_draw * 1000:.1f} ms -> {measure_draw_time() * 1000:.1f} ms"
+        print(f"Multi Importer {object_name} LODs: {summary}")
+
+    # Purge unused data
+    if addon_prefs.purge_orphans:
+        stage_start = time.perf_counter()
+        if snapshot is None:
             bpy.ops.outliner.orphans_purge(do_recursive=True)
+        else:
+            purge_created_ids(snapshot)
+        timings["purge"] = time.perf_counter() - stage_start
+
+    return timings
+
+def print_report(level, message):
+    print(f"Multi Importer {', '.join(sorted(level))}: {message}")
+
+def append_objects(blend_path):
+    """Append every object of a .blend file to the active collection. Returns the appended objects."""
+    with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
+        data_to.objects = data_from.objects
+    objects = [obj for obj in data_to.objects if obj is not None]
+    for obj in objects:
+        bpy.context.collection.objects.link(obj)
+    return objects
+
+def hash_file(filepath):
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as file:
+        while True:
+            chunk = file.read(1 << 20)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_cache_path(filepath, addon_prefs):
+    """Cache entry for a file: keyed on its content, the import and post-processing options and the Blender and add-on versions."""
+    if not getattr(addon_prefs, "use_import_cache", False):
+        return None
+    cache_dir = bpy.path.abspath(addon_prefs.cache_directory) or os.path.join(tempfile.gettempdir(), "multi_importer_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    options = {name: getattr(addon_prefs, name, None) for name in IMPORT_OPTIONS}
+    key = hashlib.sha256(json.dumps([
+        hash_file(filepath), options, bpy.context.scene.unit_settings.scale_length,
+        bl_info["version"], bpy.app.version,
+    ], sort_keys=True).encode()).hexdigest()
+    return os.path.join(cache_dir, f"{key}.blend")
+
+def load_cached_import(cache_path, object_name, addon_prefs):
+    objects = append_objects(cache_path)
+    # Touch the entry so eviction sees it as recently used
+    os.utime(cache_path)
+    if getattr(addon_prefs, "deduplicate_meshes", False):
+        deduplicate_meshes(objects)
+    mesh_objects = [obj for obj in objects if obj.type == 'MESH']
+    if addon_prefs.rename_object and len(mesh_objects) == 1:
+        mesh_objects[0].name = object_name
+        # A mesh shared with earlier imports by deduplication keeps its name
+        if "lod_0" not in mesh_objects[0] and mesh_objects[0].data.users == 1:
+            mesh_objects[0].data.name = object_name
+    _cache_stats["hits"] += 1
+    return objects
+
+def store_cached_import(cache_path, addon_prefs, objects=None, blend_path=None):
+    """Store a processed import, either from objects in this session or from a finished .blend, then evict old entries."""
+    _cache_stats["misses"] += 1
+    try:
+        if blend_path:
+            shutil.copyfile(blend_path, cache_path)
+        else:
+            bpy.data.libraries.write(cache_path, set(objects), path_remap='ABSOLUTE')
+    except OSError as e:
+        print(f"Multi Importer: could not write cache entry {cache_path}: {e}")
+        return
+    evict_import_cache(os.path.dirname(cache_path), addon_prefs.cache_size_mb * 1024 * 1024)
+
+def evict_import_cache(cache_dir, max_bytes):
+    """Remove least recently used entries until the cache fits in max_bytes."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(".blend"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def import_and_process(filepath, addon_prefs, report):
+    """Import one file and post-process what it created. Returns the objects left afterwards."""
+    object_name = to_upper_camel_case(os.path.splitext(os.path.basename(filepath))[0])
+
+    cache_path = get_cache_path(filepath, addon_prefs)
+    if cache_path and os.path.exists(cache_path):
+        return load_cached_import(cache_path, object_name, addon_prefs)
+
+    # Save existing datablocks before import
+    snapshot = snapshot_ids()
+
+    file_extension = filepath.split('.')[-1].lower()
+
+    import_file(filepath, file_extension, report, addon_prefs)
+
+    # Get list of imported objects
+    imported_objects = get_created_ids(snapshot)["objects"]
+
+    # Perform post-processing based on preferences
+    timings = post_process(imported_objects, object_name, addon_prefs, snapshot)
+    if timings:
+        print(f"Multi Importer {object_name} stages: " + ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in timings.items()))
+
+    objects = get_created_ids(snapshot)["objects"]
+    if cache_path and objects:
+        store_cached_import(cache_path, addon_prefs, objects=objects)
+    return objects
+
+def run_import_worker(filepath, output_path, options, unit_scale):
+    """Import and post-process one file in a background Blender process, writing the result to a .blend."""
+    command = [
+        bpy.app.binary_path, "--background", "--factory-startup", "--python", os.path.abspath(__file__),
+        "--", "--worker", filepath, output_path, json.dumps(options), str(unit_scale),
+    ]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if result.returncode != 0 or not os.path.exists(output_path):
+        return filepath, None, result.stdout
+    return filepath, output_path, result.stdout
+
+def import_in_workers(filepaths, addon_prefs, worker_count, report):
+    """Fan files out to background Blender processes, then append all results into this session.
+    Returns the number of files imported."""
+    options = {name: getattr(addon_prefs, name) for name in IMPORT_OPTIONS}
+    unit_scale = bpy.context.scene.unit_settings.scale_length
+    output_dir = tempfile.mkdtemp(prefix="multi_import_")
+    imported = 0
+    pending = []
+    for filepath in filepaths:
+        cache_path = get_cache_path(filepath, addon_prefs)
+        if cache_path and os.path.exists(cache_path):
+            object_name = to_upper_camel_case(os.path.splitext(os.path.basename(filepath))[0])
+            load_cached_import(cache_path, object_name, addon_prefs)
+            imported += 1
+        else:
+            pending.append((filepath, cache_path))
+    try:
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            results = list(executor.map(
+                lambda item: run_import_worker(item[1][0], os.path.join(output_dir, f"{item[0]}.blend"), options, unit_scale),
+                enumerate(pending),
+            ))
+        for (filepath, output_path, output), (_, cache_path) in zip(results, pending):
+            if output_path is None:
+                print(output)
+                report({'WARNING'}, f"Failed to import {os.path.basename(filepath)}")
+                continue
+            objects = append_objects(output_path)
+            if getattr(addon_prefs, "deduplicate_meshes", False):
+                deduplicate_meshes(objects)
+            if cache_path:
+                store_cached_import(cache_path, addon_prefs, blend_path=output_path)
+            imported += 1
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    return imported
+
+def worker_main(argv):
+    """Background worker entry point: import one file, post-process it and save the result."""
+    filepath, output_path, options, unit_scale = argv[1], argv[2], json.loads(argv[3]), float(argv[4])
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.context.scene.unit_settings.scale_length = unit_scale
+    objects = import_and_process(filepath, SimpleNamespace(**options), print_report)
+    if not objects:
+        return 1
+    bpy.data.libraries.write(output_path, set(objects), path_remap='ABSOLUTE')
+    return 0
+
+def scan_watch_directory(directory):
+    """Modification time and size of every importable file below directory, from stat calls only."""
+    index = {}
+    for root, _, files in os.walk(directory):
+        for file in files:
+            if file.split('.')[-1].lower() in MODEL_EXTENSIONS:
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                index[path] = (stat.st_mtime_ns, stat.st_size)
+    return index
+
+def start_watch(directory, interval):
+    """Index the files already in directory and start polling it for new or changed ones."""
+    index = scan_watch_directory(directory)
+    _watch_state.update(directory=directory, seen=index, imported=dict(index), queue=[])
+    bpy.app.timers.register(watch_tick, first_interval=interval, persistent=True)
+
+def watch_tick():
+    """Timer callback: queue new or changed files of the watch directory and import a few of them."""
+    addon_prefs = bpy.context.preferences.addons[__name__].preferences
+    directory = _watch_state["directory"]
+    if not os.path.isdir(directory):
+        print(f"Multi Importer: stopped watching {directory}, it no longer exists")
+        return None
+
+    index = scan_watch_directory(directory)
+    for path, signature in index.items():
+        # Wait until a file looks the same on two checks in a row, so exports still being written are not imported
+        if signature == _watch_state["seen"].get(path) and signature != _watch_state["imported"].get(path):
+            _watch_state["imported"][path] = signature
+            _watch_state["queue"].append(path)
+    _watch_state["seen"] = index
+
+    queue = _watch_state["queue"]
+    batch = queue[:addon_prefs.watch_files_per_tick]
+    del queue[:len(batch)]
+    windows = bpy.context.window_manager.windows
+    for path in batch:
+        try:
+            # Timers run without a window, which the import operators need
+            if windows:
+                with bpy.context.temp_override(window=windows[0]):
+                    import_and_process(path, addon_prefs, print_report)
+            else:
+                import_and_process(path, addon_prefs, print_report)
+            print(f"Multi Importer: imported {path} ({len(queue)} waiting)")
+        except Exception as e:
+            # An exception would unregister the timer, keep watching instead
+            print(f"Multi Importer: failed to import {path}: {e}")
+    return addon_prefs.watch_interval
+
+class WatchDirectoryOperator(Operator):
+    bl_idname = "import_scene.multi_importer_watch"
+    bl_label = "Watch Import Directory"
+    bl_description = "Start or stop importing the files that appear in the watch directory"
+
+    def execute(self, context):
+        addon_prefs = context.preferences.addons[__name__].preferences
+        if bpy.app.timers.is_registered(watch_tick):
+            bpy.app.timers.unregister(watch_tick)
+            self.report({'INFO'}, f"Stopped watching {_watch_state['directory']}")
+            return {'FINISHED'}
+
+        directory = bpy.path.abspath(addon_prefs.watch_directory)
+        if not os.path.isdir(directory):
+            self.report({'ERROR'}, "Set an existing Watch Directory in the add-on preferences")
+            return {'CANCELLED'}
+        start_watch(directory, addon_prefs.watch_interval)
+        self.report({'INFO'}, f"Watching {directory}")
+        return {'FINISHED'}
+
+class ImportAllOperator(Operator, ImportHelper):
+    bl_idname = "import_scene.multi_importer"
+    bl_label = "Import Multi Format"
+
+    filter_glob: StringProperty(
+        default="*.fbx;*.obj;*.stl;*.abc;*.usd;*.usdz;*.blend;*.zip;*.dae;*.glb;*.gltf",
+        options={'HIDDEN'},
+    )
+    files: CollectionProperty(
+        type=OperatorFileListElement,
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+    directory: StringProperty(
+        subtype='DIR_PATH',
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+    import_directory: BoolProperty(
+        name="Whole Directory",
+        description="Import every supported file in the current directory and its subdirectories",
+        default=False,
+    )
+
+    def get_filepaths(self):
+        if self.import_directory and self.directory:
+            filepaths = []
+            for root, _, files in os.walk(self.directory):
+                for file in sorted(files):
+                    if file.split('.')[-1].lower() in MODEL_EXTENSIONS:
+                        filepaths.append(os.path.join(root, file))
+            return filepaths
+        if self.directory and any(f.name for f in self.files):
+            return [os.path.join(self.directory, f.name) for f in self.files if f.name]
+        return [self.filepath]
+
+    def execute(self, context):
+        # Get addon preferences
+        addon_prefs = context.preferences.addons[__name__].preferences
+
+        filepaths = self.get_filepaths()
+        if not filepaths:
+            self.report({'WARNING'}, "No supported files found")
+            return {'CANCELLED'}
+
+        deduplicated = dict(_dedupe_stats)
+        worker_count = addon_prefs.worker_count or os.cpu_count() or 1
+        if len(filepaths) > 1 and worker_count > 1:
+            start_time = time.perf_counter()
+            imported = import_in_workers(filepaths, addon_prefs, min(worker_count, len(filepaths)), self.report)
+            self.report({'INFO'}, f"Imported {imported}/{len(filepaths)} files in {time.perf_counter() - start_time:.1f}s")
+        else:
+            for filepath in filepaths:
+                import_and_process(filepath, addon_prefs, self.report)
+
+        shared = _dedupe_stats["meshes"] - deduplicated["meshes"]
+        if shared:
+            saved = (_dedupe_stats["bytes"] - deduplicated["bytes"]) / (1024 * 1024)
+            self.report({'INFO'}, f"Shared {shared} duplicate mesh(es), saving about {saved:.1f} MB")
+
+        if addon_prefs.use_import_cache:
+            print(f"Multi Importer cache: {_cache_stats['hits']} hits, {_cache_stats['misses']} misses this session")
+        return {'FINISHED'}
 
     @staticmethod
     def menu_func_import(self, context):
@@ -321,6 +1392,7 @@ class ImportAllOperator(Operator, ImportHelper):
 def register():
     bpy.utils.register_class(MultiImporterPreferences)
     bpy.utils.register_class(ImportAllOperator)
+    bpy.utils.register_class(WatchDirectoryOperator)
     bpy.types.TOPBAR_MT_file_import.append(ImportAllOperator.menu_func_import)
 
     # Keymap
@@ -331,6 +1403,9 @@ def register():
         kmi = km.keymap_items.new(ImportAllOperator.bl_idname, 'I', 'PRESS', ctrl=True, shift=True, alt=True)
 
 def unregister():
+    if bpy.app.timers.is_registered(watch_tick):
+        bpy.app.timers.unregister(watch_tick)
+    bpy.utils.unregister_class(WatchDirectoryOperator)
     bpy.utils.unregister_class(ImportAllOperator)
     bpy.utils.unregister_class(MultiImporterPreferences)
     bpy.types.TOPBAR_MT_file_import.remove(ImportAllOperator.menu_func_import)
@@ -346,4 +1421,6 @@ def unregister():
                 break
 
 if __name__ == "__main__":
+    if "--" in sys.argv and "--worker" in sys.argv:
+        sys.exit(worker_main(sys.argv[sys.argv.index("--") + 1:]))
     register()
\ No newline at end of file
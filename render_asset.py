@@ -1,7 +1,7 @@
 bl_info = {
     "name": "Render Asset",
     "author": "Mox Alehin",
-    "version": (2, 16),
+    "version": (2, 20),
     "blender": (3, 0, 0),
     "location": "Object Menu > Render Asset, 3D Viewport Context Menu (when objects selected)",
     "description": "Fixes UV channels, bakes albedo texture, prepares material, and marks selected objects as assets",
@@ -10,10 +10,24 @@ bl_info = {
 
 import bpy
 import os
+import sys
+import math
+import shutil
+import functools
+import hashlib
 import tempfile
 import time
+import subprocess
+import numpy as np
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 from bpy.types import Operator, AddonPreferences
-from bpy.props import EnumProperty, FloatProperty
+from bpy.props import BoolProperty, EnumProperty, IntProperty, StringProperty
+
+ATLAS_UV_NAME = "AtlasBake"
+ATLAS_MAX_SIZE = 4096
+
+_cache_stats = {"hits": 0, "misses": 0}
 
 class RenderAssetPreferences(AddonPreferences):
     bl_idname = __name__
@@ -34,18 +48,539 @@ class RenderAssetPreferences(AddonPreferences):
         default='1024',
     )
 
-    sleep_time: FloatProperty(
-        name="Sleep Time",
-        description="Delay before deleting temporary file (seconds)",
-        default=0.01,
-        min=0.0,
-        max=10.0,
+    bake_mode: EnumProperty(
+        name="Bake Mode",
+        description="How the selected objects are baked",
+        items=[
+            ('OBJECT', "Per Object", "Run one bake for every object"),
+            ('ATLAS', "Atlas", "Bake all objects into shared atlases in one pass each, then split the atlases per object"),
+            ('WORKERS', "Background Workers", "Bake objects in parallel in background Blender processes"),
+        ],
+        default='OBJECT',
+    )
+
+    worker_count: IntProperty(
+        name="Bake Workers",
+        description="Background Blender processes baking at the same time (0 = CPU cores divided by Threads per Worker)",
+        default=0,
+        min=0,
+    )
+
+    worker_threads: IntProperty(
+        name="Threads per Worker",
+        description="Render threads each background bake may use",
+        default=4,
+        min=1,
+    )
+
+    texture_directory: StringProperty(
+        name="Texture Directory",
+        description="Save baked textures here as PNG files (empty = pack them into the .blend file)",
+        subtype='DIR_PATH',
+        default="",
+    )
+
+    use_bake_cache: BoolProperty(
+        name="Cache Bakes",
+        description="Reuse the baked texture of objects whose mesh, UVs and material did not change",
+        default=True,
+    )
+
+    cache_directory: StringProperty(
+        name="Cache Directory",
+        description="Where baked textures are cached (empty = system temporary directory)",
+        subtype='DIR_PATH',
+        default="",
+    )
+
+    cache_size_mb: IntProperty(
+        name="Cache Size (MB)",
+        description="Least recently used textures are removed when the cache grows beyond this size",
+        default=1024,
+        min=1,
     )
 
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "texture_resolution")
-        layout.prop(self, "sleep_time")
+        layout.prop(self, "bake_mode")
+        if self.bake_mode == 'WORKERS':
+            layout.prop(self, "worker_count")
+            layout.prop(self, "worker_threads")
+        layout.prop(self, "texture_directory")
+        layout.prop(self, "use_bake_cache")
+        if self.use_bake_cache:
+            layout.prop(self, "cache_directory")
+            layout.prop(self, "cache_size_mb")
+            layout.label(text=f"Cache this session: {_cache_stats['hits']} hits, {_cache_stats['misses']} misses")
+
+def find_bake_uv(uv_layers):
+    """The UV map named "Unwrap" if there is one, else the first."""
+    for uv_layer in uv_layers:
+        if uv_layer.name == "Unwrap":
+            return uv_layer
+    return uv_layers[0]
+
+def print_report(level, message):
+    print(f"Render Asset {', '.join(sorted(level))}: {message}")
+
+def can_bake(obj, report):
+    if not obj.material_slots or not obj.material_slots[0].material:
+        report({'WARNING'}, f"No material on object {obj.name}")
+        return False
+
+    if not obj.data.uv_layers:
+        report({'WARNING'}, f"Object {obj.name} has no UV map after fixing")
+        return False
+    return True
+
+def group_instances(objects):
+    """Group linked duplicates whose first material slot belongs to their shared mesh, they bake to one texture.
+    Returns a dict from the first object of every group to the group."""
+    groups = {}
+    for obj in objects:
+        if obj.material_slots and obj.material_slots[0].link == 'DATA':
+            owner = obj.data
+        else:
+            owner = obj
+        groups.setdefault(owner.as_pointer(), []).append(obj)
+    return {group[0]: group for group in groups.values()}
+
+def active_uv_names(mesh):
+    """Names of the active and the active render UV maps of a mesh."""
+    active = active_render = None
+    for uv_layer in mesh.uv_layers:
+        if uv_layer.active:
+            active = uv_layer.name
+        if uv_layer.active_render:
+            active_render = uv_layer.name
+    return active, active_render
+
+def restore_active_uvs(mesh, active, active_render):
+    uv_layers = mesh.uv_layers
+    if active in uv_layers:
+        uv_layers[active].active = True
+    if active_render in uv_layers:
+        uv_layers[active_render].active_render = True
+
+def prepare_bake(obj, image, report):
+    """Swap the object's first material for a copy that bakes into image. Returns the bake job, or None if the object cannot be baked."""
+    if not can_bake(obj, report):
+        return None
+
+    original_mat = obj.material_slots[0].material
+
+    uv_layers = obj.data.uv_layers
+    job = SimpleNamespace(obj=obj, original_mat=original_mat)
+    job.original_active_uv, job.original_active_render_uv = active_uv_names(obj.data)
+
+    new_mat = original_mat.copy()
+    new_mat.name = f"{original_mat.name}_{obj.name}_Bake"
+    new_mat.use_nodes = True
+
+    nodes = new_mat.node_tree.nodes
+    links = new_mat.node_tree.links
+
+    if nodes:
+        job.min_y = min(node.location.y for node in nodes)
+    else:
+        job.min_y = 0
+
+    tex_node = nodes.new('ShaderNodeTexImage')
+    tex_node.image = image
+    tex_node.select = True
+    nodes.active = tex_node
+    uv_node = nodes.new('ShaderNodeUVMap')
+
+    tex_node.location = (0, job.min_y - 120)
+    uv_node.location = (-200, job.min_y - 120)
+
+    selected_uv = find_bake_uv(uv_layers)
+    selected_uv.active_render = True
+    selected_uv.active = True
+
+    uv_node.uv_map = selected_uv.name
+
+    links.new(uv_node.outputs['UV'], tex_node.inputs['Vector'])
+
+    obj.material_slots[0].material = new_mat
+
+    job.material = new_mat
+    job.tex_node = tex_node
+    job.uv_node = uv_node
+    job.uv_name = selected_uv.name
+    return job
+
+def restore_object(job):
+    """Give the object back its original material and active UV maps."""
+    job.obj.material_slots[0].material = job.original_mat
+    restore_active_uvs(job.obj.data, job.original_active_uv, job.original_active_render_uv)
+
+def add_atlas_uv(job, column, row, grid):
+    """Copy the bake UV map into the object's atlas tile. Returns False if the mesh cannot get an atlas UV map."""
+    uv_layers = job.obj.data.uv_layers
+    atlas_uv = uv_layers.new(name=ATLAS_UV_NAME, do_init=False)
+    if atlas_uv is None:
+        return False
+    if atlas_uv.name != ATLAS_UV_NAME:
+        # A map of that name already exists, the bake would use it instead of this one
+        uv_layers.remove(atlas_uv)
+        return False
+    uv = np.empty(len(job.obj.data.loops) * 2, dtype=np.float32)
+    uv_layers[job.uv_name].data.foreach_get("uv", uv)
+    uv = uv.reshape(-1, 2)
+    uv += (column, row)
+    uv /= grid
+    atlas_uv.data.foreach_set("uv", uv.ravel())
+    # Creating a UV map can change the active ones
+    uv_layers[job.uv_name].active_render = True
+    uv_layers[job.uv_name].active = True
+    return True
+
+def remove_atlas_uv(obj):
+    uv_layers = obj.data.uv_layers
+    if ATLAS_UV_NAME in uv_layers:
+        uv_layers.remove(uv_layers[ATLAS_UV_NAME])
+
+def read_pixels(image):
+    """Pixels of an image as a (height, width, 4) float array."""
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, 4)
+
+def split_atlas(pixels, column, row, texture_size, name):
+    """Copy one tile of an atlas into a new image of its own."""
+    tile = pixels[row * texture_size:(row + 1) * texture_size, column * texture_size:(column + 1) * texture_size]
+    image = bpy.data.images.new(name, width=texture_size, height=texture_size)
+    image.pixels.foreach_set(np.ascontiguousarray(tile).ravel())
+    return image
+
+def setup_bake_scene(scene):
+    """Switch the scene to a Cycles diffuse color bake. Returns the bake type to restore afterwards."""
+    scene.render.engine = 'CYCLES'
+    original_bake_type = scene.cycles.bake_type
+    scene.cycles.bake_type = 'DIFFUSE'
+
+    scene.render.bake.use_pass_direct = False
+    scene.render.bake.use_pass_indirect = False
+    return original_bake_type
+
+def bake_selected(context, objects, uv_layer=""):
+    """Run one Cycles bake for objects, which all bake into their active image texture nodes."""
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    context.view_layer.objects.active = objects[0]
+    bpy.ops.object.bake(type='DIFFUSE', uv_layer=uv_layer)
+
+def bake_atlases(context, objects, texture_size, report):
+    """Bake objects in groups that share an atlas, one bake per atlas and one tile per mesh, then give every object
+    its own tile as an image. Objects sharing a mesh with an earlier one but not its material bake on their own.
+    Returns the baked jobs."""
+    per_side = max(1, ATLAS_MAX_SIZE // texture_size)
+    per_atlas = per_side * per_side
+    meshes = set()
+    atlas_objects = []
+    own_objects = []
+    for obj in objects:
+        (own_objects if obj.data in meshes else atlas_objects).append(obj)
+        meshes.add(obj.data)
+    baked = []
+    for start in range(0, len(atlas_objects), per_atlas):
+        group = atlas_objects[start:start + per_atlas]
+        grid = math.ceil(math.sqrt(len(group)))
+        atlas = bpy.data.images.new(f"T_Atlas_{start // per_atlas}_Bake_D", width=grid * texture_size, height=grid * texture_size)
+        jobs = []
+        for index, obj in enumerate(group):
+            job = prepare_bake(obj, atlas, report)
+            if job is None:
+                continue
+            job.tile = (index % grid, index // grid)
+            if not add_atlas_uv(job, job.tile[0], job.tile[1], grid):
+                report({'WARNING'}, f"Object {obj.name} cannot get an atlas UV map, baking it on its own")
+                restore_object(job)
+                baked.extend(bake_objects(context, [obj], texture_size, report))
+                continue
+            jobs.append(job)
+
+        if jobs:
+            try:
+                bake_selected(context, [job.obj for job in jobs], uv_layer=ATLAS_UV_NAME)
+            except Exception as e:
+                report({'WARNING'}, f"Baking failed for {', '.join(job.obj.name for job in jobs)}: {str(e)}")
+                for job in jobs:
+                    restore_object(job)
+                    remove_atlas_uv(job.obj)
+                jobs = []
+
+        pixels = read_pixels(atlas) if jobs else None
+        for job in jobs:
+            image = split_atlas(pixels, job.tile[0], job.tile[1], texture_size, f"T_{job.obj.name}_Bake_D")
+            job.tex_node.image = image
+            job.image = image
+            remove_atlas_uv(job.obj)
+            baked.append(job)
+        bpy.data.images.remove(atlas)
+    baked.extend(bake_objects(context, own_objects, texture_size, report))
+    return baked
+
+def bake_objects(context, objects, texture_size, report):
+    """Bake every object on its own. Returns the baked jobs."""
+    baked = []
+    for obj in objects:
+        image = bpy.data.images.new(f"T_{obj.name}_Bake_D", width=texture_size, height=texture_size)
+        job = prepare_bake(obj, image, report)
+        if job is None:
+            bpy.data.images.remove(image)
+            continue
+        job.image = image
+        try:
+            bake_selected(context, [obj])
+        except Exception as e:
+            report({'WARNING'}, f"Baking failed for {obj.name}: {str(e)}")
+            restore_object(job)
+            continue
+        baked.append(job)
+    return baked
+
+def get_bake_settings(scene):
+    """The scene's Cycles samples, bake margin and margin type, as command line arguments for a worker."""
+    return [str(scene.cycles.samples), str(scene.render.bake.margin), getattr(scene.render.bake, "margin_type", "")]
+
+def apply_bake_settings(scene, settings):
+    samples, margin, margin_type = settings
+    scene.cycles.samples = int(samples)
+    scene.render.bake.margin = int(margin)
+    # The margin type exists since Blender 3.1
+    if margin_type and hasattr(scene.render.bake, "margin_type"):
+        scene.render.bake.margin_type = margin_type
+
+def run_bake_worker(blend_path, object_name, output_path, texture_size, threads, settings):
+    """Bake one object in a background Blender process with the given bake settings.
+    Returns whether the PNG was written, and the process output."""
+    command = [
+        bpy.app.binary_path, "--background", "--factory-startup", "--python", os.path.abspath(__file__),
+        "--", "--bake-worker", blend_path, object_name, output_path, str(texture_size), str(threads), *settings,
+    ]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return result.returncode == 0 and os.path.exists(output_path), result.stdout
+
+def bake_in_workers(objects, texture_size, worker_count, threads, report):
+    """Bake every object in a pool of background Blender processes with the scene's bake settings,
+    then assign the baked images here. Returns the baked jobs."""
+    settings = get_bake_settings(bpy.context.scene)
+    work_dir = tempfile.mkdtemp(prefix="render_asset_")
+    tasks = []
+    for index, obj in enumerate(objects):
+        if not can_bake(obj, report):
+            continue
+        blend_path = os.path.join(work_dir, f"{index}.blend")
+        bpy.data.libraries.write(blend_path, {obj}, path_remap='ABSOLUTE')
+        tasks.append((obj, obj.name, blend_path, os.path.join(work_dir, f"{index}.png")))
+
+    baked = []
+    try:
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            results = list(executor.map(
+                lambda task: run_bake_worker(task[2], task[1], task[3], texture_size, threads, settings), tasks,
+            ))
+        for (obj, name, _, output_path), (success, output) in zip(tasks, results):
+            if not success:
+                print(output)
+                report({'WARNING'}, f"Baking failed for {name}")
+                continue
+            image = bpy.data.images.load(output_path)
+            image.name = f"T_{name}_Bake_D"
+            image.pack()
+            job = prepare_bake(obj, image, report)
+            job.image = image
+            baked.append(job)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return baked
+
+def bake_worker_main(argv):
+    """Background worker entry point: bake one object of a .blend file into a PNG."""
+    blend_path, object_name, output_path = argv[1], argv[2], argv[3]
+    texture_size, threads = int(argv[4]), int(argv[5])
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
+        data_to.objects = [object_name]
+    obj = data_to.objects[0]
+    scene = bpy.context.scene
+    scene.collection.objects.link(obj)
+    setup_bake_scene(scene)
+    apply_bake_settings(scene, argv[6:9])
+    scene.render.threads_mode = 'FIXED'
+    scene.render.threads = threads
+
+    image = bpy.data.images.new(f"T_{object_name}_Bake_D", width=texture_size, height=texture_size)
+    if prepare_bake(obj, image, print_report) is None:
+        return 1
+    bake_selected(bpy.context, [obj])
+    image.save(filepath=output_path)
+    return 0
+
+def write_png(image, filepath):
+    """Write an image to filepath as PNG: its packed bytes when it is packed, else its pixels, after which it refers to that file."""
+    if image.packed_file:
+        with open(filepath, 'wb') as file:
+            file.write(image.packed_file.data)
+    else:
+        image.filepath_raw = filepath
+        image.file_format = 'PNG'
+        image.save()
+
+def store_baked_image(image, texture_directory):
+    """Keep the baked pixels, saved once into texture_directory or packed straight from memory."""
+    if texture_directory:
+        os.makedirs(texture_directory, exist_ok=True)
+        filepath = os.path.join(texture_directory, f"{image.name}.png")
+        write_png(image, filepath)
+        if image.packed_file:
+            image.filepath_raw = filepath
+            image.unpack(method='REMOVE')
+    elif not image.packed_file:
+        image.pack()
+
+def hash_value(value, digest, seen, image_hashes):
+    """Feed a node property or socket value into digest, following images, node groups, color ramps, curves
+    and nested settings such as texture mappings and image users. image_hashes memoizes packed images by pointer."""
+    if isinstance(value, bpy.types.Image):
+        filepath = bpy.path.abspath(value.filepath)
+        if value.packed_file:
+            pointer = value.as_pointer()
+            if pointer not in image_hashes:
+                image_hashes[pointer] = hashlib.sha256(value.packed_file.data).digest()
+            digest.update(image_hashes[pointer])
+        elif os.path.exists(filepath):
+            stat = os.stat(filepath)
+            digest.update(repr((filepath, stat.st_mtime_ns, stat.st_size)).encode())
+        else:
+            digest.update(repr((value.name, value.source, tuple(value.size))).encode())
+    elif isinstance(value, bpy.types.NodeTree):
+        hash_node_tree(value, digest, seen, image_hashes)
+    elif isinstance(value, bpy.types.ColorRamp):
+        digest.update(repr((value.interpolation, [(e.position, tuple(e.color)) for e in value.elements])).encode())
+    elif isinstance(value, bpy.types.CurveMapping):
+        digest.update(repr([[tuple(p.location) for p in curve.points] for curve in value.curves]).encode())
+    elif isinstance(value, bpy.types.ID) or value is None:
+        digest.update(repr(getattr(value, "name", None)).encode())
+    elif isinstance(value, bpy.types.bpy_struct):
+        if value.as_pointer() in seen:
+            return
+        seen.add(value.as_pointer())
+        for prop in value.bl_rna.properties:
+            if prop.identifier != "rna_type":
+                digest.update(prop.identifier.encode())
+                hash_value(getattr(value, prop.identifier), digest, seen, image_hashes)
+    elif isinstance(value, bpy.types.bpy_prop_collection):
+        for item in value:
+            hash_value(item, digest, seen, image_hashes)
+    elif isinstance(value, set):
+        digest.update(repr(sorted(value)).encode())
+    elif isinstance(value, (str, int, float, bool)):
+        digest.update(repr(value).encode())
+    else:
+        # Vector and color sockets and array properties
+        digest.update(repr(tuple(value)).encode())
+
+def hash_node_tree(node_tree, digest, seen=None, image_hashes=None):
+    """Feed the nodes, their settings and input values, and the links of a node tree into digest."""
+    seen = set() if seen is None else seen
+    image_hashes = {} if image_hashes is None else image_hashes
+    if node_tree.as_pointer() in seen:
+        return
+    seen.add(node_tree.as_pointer())
+    base_properties = {prop.identifier for prop in bpy.types.Node.bl_rna.properties}
+    for node in sorted(node_tree.nodes, key=lambda node: node.name):
+        digest.update(repr((node.bl_idname, node.name)).encode())
+        for prop in node.bl_rna.properties:
+            if prop.identifier not in base_properties:
+                digest.update(prop.identifier.encode())
+                hash_value(getattr(node, prop.identifier), digest, seen, image_hashes)
+        for socket in node.inputs:
+            if hasattr(socket, "default_value"):
+                digest.update(socket.identifier.encode())
+                hash_value(socket.default_value, digest, seen, image_hashes)
+    for link in node_tree.links:
+        digest.update(repr((link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier)).encode())
+
+def bake_digest(obj, depsgraph, texture_size, image_hashes):
+    """Digest of everything the baked texture depends on: the evaluated mesh, the bake UV map, the material and the resolution.
+    image_hashes is shared across the objects of a run so every packed image is hashed once."""
+    digest = hashlib.sha256(repr((bpy.app.version, texture_size)).encode())
+    mesh = obj.evaluated_get(depsgraph).data
+    for collection, attribute, dtype, size in (
+        (mesh.vertices, "co", np.float32, 3), (mesh.loops, "vertex_index", np.int32, 1),
+        (mesh.polygons, "loop_start", np.int32, 1), (mesh.polygons, "material_index", np.int32, 1),
+    ):
+        values = np.empty(len(collection) * size, dtype=dtype)
+        collection.foreach_get(attribute, values)
+        digest.update(values.tobytes())
+    uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    find_bake_uv(mesh.uv_layers).data.foreach_get("uv", uv)
+    digest.update(uv.tobytes())
+    for slot in obj.material_slots:
+        if slot.material and slot.material.node_tree:
+            hash_node_tree(slot.material.node_tree, digest, image_hashes=image_hashes)
+        else:
+            digest.update(repr(slot.material.diffuse_color[:] if slot.material else None).encode())
+    return digest.hexdigest()
+
+def get_cache_dir(prefs):
+    cache_dir = bpy.path.abspath(prefs.cache_directory) or os.path.join(tempfile.gettempdir(), "render_asset_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def load_cached_bake(obj, cache_path, report):
+    """Assign a cached texture to the object the same way a fresh bake is. Returns the bake job."""
+    image = bpy.data.images.load(cache_path)
+    image.name = f"T_{obj.name}_Bake_D"
+    image.pack()
+    # Touch the entry so eviction sees it as recently used
+    os.utime(cache_path)
+    job = prepare_bake(obj, image, report)
+    job.image = image
+    return job
+
+def evict_bake_cache(cache_dir, max_bytes):
+    """Remove least recently used textures until the cache fits in max_bytes."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(".png"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def restore_after_previews(materials):
+    """Timer callback: give the objects back their materials once no asset preview is rendering any more.
+    Objects and materials are looked up by name, since undo may have replaced or removed them meanwhile."""
+    if hasattr(bpy.app, "is_job_running") and bpy.app.is_job_running('RENDER_PREVIEW'):
+        return 0.1
+    for object_name, material_name in materials:
+        obj = bpy.data.objects.get(object_name)
+        material = bpy.data.materials.get(material_name)
+        if obj is None or material is None or not obj.material_slots:
+            continue
+        obj.material_slots[0].material = material
+    # The operator's undo step holds the baked materials, record the restored ones as a step of their own.
+    # Timers run without a window, which undo_push needs, and without one there is no undo history to add to
+    windows = bpy.context.window_manager.windows
+    if windows:
+        with bpy.context.temp_override(window=windows[0], screen=windows[0].screen):
+            bpy.ops.ed.undo_push(message="Render Asset restore materials")
+    return None
 
 class OBJECT_OT_RenderAsset(Operator):
     bl_idname = "object.render_asset"
@@ -59,173 +594,135 @@ class OBJECT_OT_RenderAsset(Operator):
     def execute(self, context):
         prefs = context.preferences.addons[__name__].preferences
         texture_size = int(prefs.texture_resolution)
-        sleep_time = prefs.sleep_time
+        texture_directory = bpy.path.abspath(prefs.texture_directory)
 
         selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
-        
+
         if not selected_objects:
             self.report({'ERROR'}, "No mesh objects selected")
             return {'CANCELLED'}
 
-        processed_objects = 0
+        # Linked duplicates share their first material through the mesh, so they bake once and share the texture
+        instances = group_instances(selected_objects)
+        representatives = list(instances)
+        # Objects sharing a mesh change its active UV maps one after another, keep the state from before any of them
+        uv_states = {obj.data: active_uv_names(obj.data) for obj in representatives}
+
+        scene = context.scene
+        original_bake_type = setup_bake_scene(scene)
+
+        # Reuse the textures of objects baked before with the same mesh, UVs, material and resolution
+        cached = []
+        cache_paths = {}
+        to_bake = representatives
+        cache_dir = get_cache_dir(prefs) if prefs.use_bake_cache else None
+        if cache_dir:
+            depsgraph = context.evaluated_depsgraph_get()
+            image_hashes = {}
+            to_bake = []
+            for obj in representatives:
+                if not can_bake(obj, self.report):
+                    continue
+                cache_path = os.path.join(cache_dir, f"{bake_digest(obj, depsgraph, texture_size, image_hashes)}.png")
+                if os.path.exists(cache_path):
+                    cached.append(load_cached_bake(obj, cache_path, self.report))
+                else:
+                    cache_paths[obj] = cache_path
+                    to_bake.append(obj)
+            _cache_stats["hits"] += len(cached)
+            _cache_stats["misses"] += len(to_bake)
+
+        start_time = time.perf_counter()
+        if not to_bake:
+            baked = []
+        elif prefs.bake_mode == 'WORKERS':
+            worker_count = prefs.worker_count or max(1, (os.cpu_count() or 1) // prefs.worker_threads)
+            baked = bake_in_workers(to_bake, texture_size, worker_count, prefs.worker_threads, self.report)
+        elif prefs.bake_mode == 'ATLAS':
+            baked = bake_atlases(context, to_bake, texture_size, self.report)
+        else:
+            baked = bake_objects(context, to_bake, texture_size, self.report)
+        bake_time = time.perf_counter() - start_time
+
+        if cache_dir:
+            for job in baked:
+                try:
+                    write_png(job.image, cache_paths[job.obj])
+                except (OSError, RuntimeError) as e:
+                    print(f"Render Asset: could not write cache entry for {job.obj.name}: {e}")
+            evict_bake_cache(cache_dir, prefs.cache_size_mb * 1024 * 1024)
+        baked = cached + baked
+
+        processed_jobs = []
 
-        for obj in selected_objects:
+        for job in baked:
+            obj = job.obj
             for o in selected_objects:
                 o.select_set(False)
             obj.select_set(True)
             context.view_layer.objects.active = obj
 
-            if not obj.material_slots or not obj.material_slots[0].material:
-                self.report({'WARNING'}, f"No material on object {obj.name}")
-                continue
-
-            if not obj.data.uv_layers:
-                self.report({'WARNING'}, f"Object {obj.name} has no UV map after fixing")
-                continue
+            nodes = job.material.node_tree.nodes
+            links = job.material.node_tree.links
+            tex_node = job.tex_node
+            min_y = job.min_y
 
-            original_mat = obj.material_slots[0].material
-            
-            uv_layers = obj.data.uv_layers
-            original_active_uv = None
-            original_active_render_uv = None
-            for uv_layer in uv_layers:
-                if uv_layer.active:
-                    original_active_uv = uv_layer
-                if uv_layer.active_render:
-                    original_active_render_uv = uv_layer
-            
-            new_mat = original_mat.copy()
-            new_mat.name = f"{original_mat.name}_{obj.name}_Bake"
-            new_mat.use_nodes = True
-            
-            nodes = new_mat.node_tree.nodes
-            links = new_mat.node_tree.links
-            
-            if nodes:
-                min_y = min(node.location.y for node in nodes)
-            else:
-                min_y = 0
-            
-            temp_image_name = f"T_{obj.name}_Bake_D"
-            temp_image = bpy.data.images.new(temp_image_name, width=texture_size, height=texture_size)
-            
-            tex_node = nodes.new('ShaderNodeTexImage')
-            tex_node.image = temp_image
-            tex_node.select = True
-            nodes.active = tex_node
-            uv_node = nodes.new('ShaderNodeUVMap')
-            
-            tex_node.location = (0, min_y - 120)
-            uv_node.location = (-200, min_y - 120)
-            
-            selected_uv = None
-            for uv_layer in uv_layers:
-                if uv_layer.name == "Unwrap":
-                    selected_uv = uv_layer
-                    break
-            if not selected_uv:
-                selected_uv = uv_layers[0]
-            
-            selected_uv.active_render = True
-            selected_uv.active = True
-            
-            uv_node.uv_map = selected_uv.name
-            
-            links.new(uv_node.outputs['UV'], tex_node.inputs['Vector'])
-            
-            obj.material_slots[0].material = new_mat
-            
-            scene = context.scene
-            scene.render.engine = 'CYCLES'
-            original_bake_type = scene.cycles.bake_type
-            scene.cycles.bake_type = 'DIFFUSE'
-            
-            scene.render.bake.use_pass_direct = False
-            scene.render.bake.use_pass_indirect = False
-            
-            try:
-                bpy.ops.object.bake(type='DIFFUSE')
-            except Exception as e:
-                self.report({'WARNING'}, f"Baking failed for {obj.name}: {str(e)}")
-                obj.material_slots[0].material = original_mat
-                if original_active_uv:
-                    original_active_uv.active = True
-                if original_active_render_uv:
-                    original_active_render_uv.active_render = True
-                continue
-            
-            temp_dir = tempfile.gettempdir()
-            temp_filepath = os.path.join(temp_dir, f"{temp_image_name}.png")
             try:
-                temp_image.save(filepath=temp_filepath)
+                store_baked_image(job.image, texture_directory)
             except Exception as e:
                 self.report({'WARNING'}, f"Failed to save texture for {obj.name}: {str(e)}")
-                obj.material_slots[0].material = original_mat
-                if original_active_uv:
-                    original_active_uv.active = True
-                if original_active_render_uv:
-                    original_active_render_uv.active_render = True
+                restore_object(job)
                 continue
-            
-            if not os.path.exists(temp_filepath):
-                self.report({'WARNING'}, f"Texture file not found for {obj.name}: {temp_filepath}")
-                obj.material_slots[0].material = original_mat
-                if original_active_uv:
-                    original_active_uv.active = True
-                if original_active_render_uv:
-                    original_active_render_uv.active_render = True
-                continue
-            
-            nodes_to_keep = {tex_node, uv_node}
+
+            nodes_to_keep = {tex_node, job.uv_node}
             for node in list(nodes):
                 if node not in nodes_to_keep:
                     nodes.remove(node)
-            
+
             diffuse_node = nodes.new('ShaderNodeBsdfDiffuse')
             diffuse_node.inputs['Roughness'].default_value = 1.0
             output_node = nodes.new('ShaderNodeOutputMaterial')
-            
+
             diffuse_node.location = (300, min_y - 120)
             output_node.location = (500, min_y - 120)
-            
+
             links.new(tex_node.outputs['Color'], diffuse_node.inputs['Color'])
             links.new(diffuse_node.outputs['BSDF'], output_node.inputs['Surface'])
-            
+
             try:
-                obj.asset_clear()
-                obj.asset_mark()
-                obj.asset_generate_preview()
+                for instance in instances[obj]:
+                    instance.asset_clear()
+                    instance.asset_mark()
+                    instance.asset_generate_preview()
             except Exception as e:
                 self.report({'WARNING'}, f"Failed to mark {obj.name} as asset: {str(e)}")
-                obj.material_slots[0].material = original_mat
-                if original_active_uv:
-                    original_active_uv.active = True
-                if original_active_render_uv:
-                    original_active_render_uv.active_render = True
+                restore_object(job)
                 continue
-            
-            time.sleep(sleep_time)
-            
-            try:
-                os.remove(temp_filepath)
-            except:
-                pass
-            
-            obj.material_slots[0].material = original_mat
-            
-            if original_active_uv:
-                original_active_uv.active = True
-            if original_active_render_uv:
-                original_active_render_uv.active_render = True
-            
-            scene.cycles.bake_type = original_bake_type
-            
-            processed_objects += 1
+
+            processed_jobs.append(job)
+
+        scene.cycles.bake_type = original_bake_type
+
+        # The baked materials name their UV map, so the previews do not need the active ones
+        for mesh, (active, active_render) in uv_states.items():
+            restore_active_uvs(mesh, active, active_render)
 
         for o in selected_objects:
             o.select_set(True)
 
-        self.report({'INFO'}, f"Processed {processed_objects} objects as assets")
+        # Previews render in the background with the baked material, restore the originals once they are done
+        if processed_jobs:
+            materials = [(job.obj.name, job.original_mat.name) for job in processed_jobs]
+            bpy.app.timers.register(functools.partial(restore_after_previews, materials), first_interval=0.1)
+
+        processed_objects = sum(len(instances[job.obj]) for job in processed_jobs)
+        message = f"Processed {processed_objects} objects as assets, baking took {bake_time:.1f}s"
+        if cache_dir:
+            message += f", {len(cached)}/{len(cached) + len(to_bake)} reused from the bake cache"
+            total = _cache_stats["hits"] + _cache_stats["misses"]
+            if total:
+                print(f"Render Asset cache: {_cache_stats['hits']} hits, {_cache_stats['misses']} misses this session ({_cache_stats['hits'] / total:.0%} hit rate)")
+        self.report({'INFO'}, message)
         return {'FINISHED'}
 
 def register():
@@ -237,4 +734,6 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_OT_RenderAsset)
 
 if __name__ == "__main__":
-    register()
\ No newline at end of file
+    if "--" in sys.argv and "--bake-worker" in sys.argv:
+        sys.exit(bake_worker_main(sys.argv[sys.argv.index("--") + 1:]))
+    register()